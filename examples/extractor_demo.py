@@ -6,13 +6,14 @@ This script demonstrates various ways to use the PDF extractor to read
 every word and image from PDF documents.
 """
 
+import re
 import sys
 from pathlib import Path
 
 # Add parent directory to path to import pdf_extractor
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pdf_extractor import PDFExtractor, PDFExtraction
+from pdf_extractor import PDFExtractor, PDFExtraction, largest_indices, mean_font_size
 
 
 def example_1_basic_extraction():
@@ -24,7 +25,7 @@ def example_1_basic_extraction():
     # Replace with your PDF path
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         print("Please provide a valid PDF path")
         return
@@ -61,7 +62,7 @@ def example_2_with_images():
 
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         return
 
@@ -106,7 +107,7 @@ def example_3_with_ocr():
 
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         return
 
@@ -150,45 +151,52 @@ def example_4_analyze_specific_page():
 
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         return
 
-    extractor = PDFExtractor(pdf_path=pdf_path, extract_images=True)
-    extraction = extractor.extract()
+    extractor = PDFExtractor(pdf_path=pdf_path, extract_images=True, decode_pixels=False)
 
-    # Analyze first page
-    if extraction.pages:
-        page = extraction.pages[0]
+    # Only the first page is needed, so stop after extracting it
+    pages = extractor.iter_pages()
+    page = next(pages, None)
+    pages.close()
 
-        print(f"\nPage 1 Analysis:")
-        print(f"  Dimensions: {page.width:.1f} x {page.height:.1f}")
-        print(f"  Rotation: {page.rotation}°")
-        print(f"  Words: {page.word_count}")
-        print(f"  Images: {page.image_count}")
+    # Analyze first page, collecting the report into one write
+    if page is not None:
+        lines = [
+            "\nPage 1 Analysis:",
+            f"  Dimensions: {page.width:.1f} x {page.height:.1f}",
+            f"  Rotation: {page.rotation}°",
+            f"  Words: {page.word_count}",
+            f"  Images: {page.image_count}",
+        ]
 
         # Word statistics
         if page.words:
-            font_sizes = [w.font_size for w in page.words if w.font_size > 0]
-            if font_sizes:
-                avg_font = sum(font_sizes) / len(font_sizes)
-                print(f"\n  Average font size: {avg_font:.1f}")
+            font_sizes = page.font_sizes_np
+            avg_font = mean_font_size(font_sizes)
+            if avg_font:
+                lines.append(f"\n  Average font size: {avg_font:.1f}")
 
-            # Find largest words (likely headings)
-            sorted_words = sorted(page.words, key=lambda w: w.font_size, reverse=True)
-            print("\n  Largest words (likely headings):")
-            for word in sorted_words[:5]:
-                print(f"    '{word.text}' (size: {word.font_size:.1f})")
+            # Find largest words (likely headings) without sorting the whole page
+            lines.append("\n  Largest words (likely headings):")
+            for i in largest_indices(font_sizes, 5):
+                word = page.words[i]
+                lines.append(f"    '{word.text}' (size: {word.font_size:.1f})")
 
         # Image analysis
         if page.images:
-            print(f"\n  Image details:")
+            lines.append(f"\n  Image details:")
             for img in page.images:
-                print(f"    {img.name}:")
-                print(f"      Size: {img.width}x{img.height}")
-                print(f"      Position: ({img.x0:.1f}, {img.y0:.1f})")
-                print(f"      Format: {img.format}")
-                print(f"      File size: {img.size_bytes / 1024:.1f} KB")
+                lines.append(f"    {img.name}:")
+                lines.append(f"      Size: {img.width}x{img.height}")
+                lines.append(f"      Position: ({img.x0:.1f}, {img.y0:.1f})")
+                lines.append(f"      Format: {img.format}")
+                if img.size_bytes:
+                    lines.append(f"      File size: {img.size_bytes / 1024:.1f} KB")
+
+        print("\n".join(lines))
 
 
 def example_5_search_content():
@@ -199,34 +207,38 @@ def example_5_search_content():
 
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         return
 
     extractor = PDFExtractor(pdf_path=pdf_path)
-    extraction = extractor.extract()
 
     # Search for a word
     search_term = "the"  # Change to your search term
     print(f"\nSearching for '{search_term}'...")
 
+    # Stream pages and keep only the matches that will be shown
+    pattern = re.compile(re.escape(search_term.lower()))
+    match_count = 0
     matches = []
-    for page in extraction.pages:
-        for word in page.words:
-            if search_term.lower() in word.text.lower():
-                matches.append({
-                    'page': page.page_number,
-                    'text': word.text,
-                    'position': (word.x0, word.y0)
-                })
-
-    print(f"\nFound {len(matches)} occurrences:")
-    for i, match in enumerate(matches[:10], 1):  # Show first 10
+    for page in extractor.iter_pages():
+        word_indices = page.find_words(pattern)
+        match_count += len(word_indices)
+        for i in word_indices[:10 - len(matches)]:
+            word = page.words[i]
+            matches.append({
+                'page': page.page_number,
+                'text': word.text,
+                'position': (word.x0, word.y0)
+            })
+
+    print(f"\nFound {match_count} occurrences:")
+    for i, match in enumerate(matches, 1):  # Show first 10
         print(f"  {i}. Page {match['page']}: '{match['text']}' "
               f"at ({match['position'][0]:.1f}, {match['position'][1]:.1f})")
 
-    if len(matches) > 10:
-        print(f"  ... and {len(matches) - 10} more")
+    if match_count > 10:
+        print(f"  ... and {match_count - 10} more")
 
 
 def example_6_text_report():
@@ -237,7 +249,7 @@ def example_6_text_report():
 
     pdf_path = "sample.pdf"
 
-    if not Path(pdf_path).exists():
+    if not Path(pdf_path).is_file():
         print(f"Sample PDF not found: {pdf_path}")
         return
 
@@ -17,12 +17,22 @@ Usage:
 """
 
 import sys
+import os
 import json
 import argparse
-import base64
+import asyncio
+import binascii
+import functools
+import hashlib
+import mmap
+import re
+import tempfile
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 import io
 
@@ -33,9 +43,19 @@ except ImportError:
     print("Error: pikepdf not installed. Install with: pip install pikepdf")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy not installed. Install with: pip install numpy")
+    sys.exit(1)
+
 # Optional dependencies
 try:
-    import PyMuPDF as fitz
+    # The PyMuPDF package installs as "pymupdf" (1.24+) and the legacy "fitz"
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz
     HAS_PYMUPDF = True
 except ImportError:
     HAS_PYMUPDF = False
@@ -44,6 +64,7 @@ except ImportError:
 
 try:
     import pdfplumber
+    from pdfminer.pdftypes import resolve1
     HAS_PDFPLUMBER = True
 except ImportError:
     HAS_PDFPLUMBER = False
@@ -63,8 +84,311 @@ try:
 except ImportError:
     HAS_TESSERACT = False
 
+try:
+    import tesserocr
+    HAS_TESSEROCR = True
+except ImportError:
+    HAS_TESSEROCR = False
 
-@dataclass
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# numba compiles the mean font size kernel below, but importing it and
+# loading its compiled cache costs several hundred milliseconds in every
+# process, more than it saves on pages of a few hundred words; it is only
+# used when PDF_EXTRACTOR_NUMBA=1 is set
+HAS_NUMBA = False
+if os.environ.get('PDF_EXTRACTOR_NUMBA') == '1':
+    try:
+        from numba import njit
+        HAS_NUMBA = True
+    except ImportError:
+        pass
+
+# Per-instance __dict__ is dropped where the interpreter supports it, since a
+# document can hold hundreds of thousands of word records
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# File extension PyMuPDF's extract_image() reports for each image stream
+# filter; streams with any other filter are re-encoded as PNG
+_FILTER_FORMATS = {'DCTDecode': 'jpeg', 'JPXDecode': 'jpx', 'JBIG2Decode': 'jb2'}
+
+# Filters whose streams extract_image() returns byte for byte, so the stream
+# length is the extracted file's size
+_PASSTHROUGH_FILTERS = frozenset(['DCTDecode', 'JPXDecode'])
+
+# Files larger than this are memory-mapped for pdfplumber
+_MMAP_THRESHOLD = 1 << 20
+
+# Threads writing extracted images to disk, and the maximum number of
+# images waiting to be written
+_IMAGE_WRITERS = 4
+_IMAGE_QUEUE_SIZE = 64
+
+# Buffer size for report files, so per-page writes reach the OS in large chunks
+_WRITE_BUFFER = 1 << 20
+
+# Decoded images kept for reuse when the same xref appears on later pages
+_IMAGE_CACHE_BYTES = 64 << 20
+
+# A page's images are stacked into one canvas for a single Tesseract run;
+# keep a blank gap between them and cap the canvas height
+_OCR_GAP = 32
+_OCR_MAX_HEIGHT = 16000
+
+# OCR results keyed by the OCR engine and the SHA-1 of the image bytes, kept
+# across runs so re-extracting a document (or a remediated copy of it) skips
+# Tesseract. The file holds recognised page text, so it is only used when
+# asked for (ocr_cache=True or PDF_EXTRACTOR_OCR_CACHE=1), and it keeps the
+# most recently used entries up to a fixed count
+_OCR_CACHE_PATH = Path.home() / '.cache' / 'pdf_extractor' / 'ocr_cache.json'
+_OCR_CACHE_MAX_ENTRIES = 5000
+_ocr_cache: Optional[Dict[str, str]] = None
+
+# Substrings of a lowercased font name that mark its weight and slant
+_BOLD_MARKERS = ('bold', 'black', 'heavy')
+_ITALIC_MARKERS = ('italic', 'oblique')
+
+
+def _mean_font_size_np(font_sizes: np.ndarray) -> float:
+    """Average of the known (positive) font sizes, or 0.0 if there are none."""
+    known = font_sizes[font_sizes > 0]
+    return float(known.mean()) if known.size else 0.0
+
+
+def _largest_indices_np(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first; ties keep document order."""
+    k = min(k, len(values))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    # Linear-time selection of the k-th largest value, then take everything
+    # above it plus the earliest ties, instead of sorting the whole page
+    kth = np.partition(values, len(values) - k)[len(values) - k]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - len(above)]
+    top = np.concatenate((above, ties))
+    return top[np.argsort(-values[top], kind='stable')]
+
+
+def _spans_columns_np(x0: np.ndarray, page_width: float) -> bool:
+    """Whether word left edges span more than 70% of the page width."""
+    return bool(x0.size) and float(np.ptp(x0)) > page_width * 0.7
+
+
+def _build_word_arrays(raw: List[tuple]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Split PyMuPDF "words" tuples into a coordinate array and the word strings.
+
+    The tuples are transposed with zip() so NumPy converts four flat
+    columns at C speed, instead of a Python-level slice for every word.
+
+    Args:
+        raw: (x0, y0, x1, y1, text, block_no, line_no, word_no) tuples
+
+    Returns:
+        (N, 4) float64 array of x0, y0, x1, y1 and the list of N texts
+    """
+    if not raw:
+        return np.empty((0, 4), dtype=np.float64), []
+    x0, y0, x1, y1, texts = list(zip(*raw))[:5]
+    return np.array((x0, y0, x1, y1), dtype=np.float64).T, list(texts)
+
+
+def _word_fonts(raw: List[tuple], text_dict: Dict[str, Any]) -> Tuple[List[str], np.ndarray]:
+    """
+    Look up the font of each PyMuPDF word in the spans of the same text page.
+
+    "words" output carries no font, but each word names the block and line
+    it came from, so only the few spans of that line are searched; the word
+    takes the last span starting at or before its left edge.
+
+    Args:
+        raw: (x0, y0, x1, y1, text, block_no, line_no, word_no) tuples
+        text_dict: get_text("dict") output for the same text page
+
+    Returns:
+        Font name per word and a float64 array of font size per word
+    """
+    blocks = {block['number']: block for block in text_dict['blocks'] if 'lines' in block}
+    names: List[str] = []
+    sizes: List[float] = []
+    for x0, _, _, _, _, block_no, line_no, _ in raw:
+        try:
+            spans = blocks[block_no]['lines'][line_no]['spans']
+        except (KeyError, IndexError):
+            names.append('')
+            sizes.append(0.0)
+            continue
+        span = spans[0]
+        for candidate in spans[1:]:
+            if candidate['bbox'][0] > x0 + 0.5:
+                break
+            span = candidate
+        names.append(span['font'])
+        sizes.append(span['size'])
+    return names, np.array(sizes, dtype=np.float64)
+
+
+def _text_from_words(texts: List[str], tops: np.ndarray, x0: np.ndarray,
+                     y_tolerance: float = 3) -> str:
+    """
+    Lay words out as plain text, one line per row of words.
+
+    Words whose tops lie within y_tolerance of the previous word's, in
+    vertical order, share a line; each line reads left to right. This is
+    how pdfplumber's extract_text() builds its default (non-layout) text,
+    but it starts from words that were already extracted.
+
+    Args:
+        texts: Word strings
+        tops: Top coordinate of each word
+        x0: Left coordinate of each word
+        y_tolerance: Largest vertical step still treated as the same line
+
+    Returns:
+        Words joined by spaces within a line and newlines between lines
+    """
+    if not texts:
+        return ""
+    order = np.argsort(tops, kind='stable')
+    new_line = np.concatenate(([False], np.diff(tops[order]) > y_tolerance))
+    line = np.empty(len(texts), dtype=np.int64)
+    line[order] = np.cumsum(new_line)
+
+    reading_order = np.lexsort((x0, line))
+    words = [texts[i] for i in reading_order.tolist()]
+    breaks = (np.flatnonzero(np.diff(line[reading_order])) + 1).tolist()
+    return "\n".join(" ".join(words[start:end])
+                     for start, end in zip([0] + breaks, breaks + [len(words)]))
+
+
+@functools.lru_cache(maxsize=256)
+def _font_style(font_name: str) -> Tuple[bool, bool]:
+    """
+    Return (is_bold, is_italic) for a font name such as "ABCDEF+Arial-BoldItalicMT".
+
+    A document uses a handful of fonts across all its words, so results
+    are cached and each distinct name is only inspected once.
+    """
+    name = font_name.lower()
+    return (any(marker in name for marker in _BOLD_MARKERS),
+            any(marker in name for marker in _ITALIC_MARKERS))
+
+
+def _read_ocr_cache() -> Dict[str, str]:
+    """Read the OCR cache file, ignoring a missing, corrupt or foreign one."""
+    try:
+        with open(_OCR_CACHE_PATH, 'rb') as f:
+            data = json.loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {key: text for key, text in data.items() if isinstance(text, str)}
+
+
+def _get_ocr_cache() -> Dict[str, str]:
+    """Return the process-wide OCR cache, reading it from disk on first use."""
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = _read_ocr_cache()
+    return _ocr_cache
+
+
+def _save_ocr_cache(entries: Dict[str, str]) -> None:
+    """
+    Add OCR results to the cache file.
+
+    The file is read again just before writing, so results another process
+    saved since this one loaded the cache are kept rather than overwritten,
+    and the merged cache replaces the old file atomically. Entries are kept
+    in order of last use; the added ones move to the end and the oldest are
+    dropped beyond _OCR_CACHE_MAX_ENTRIES.
+
+    Args:
+        entries: Cache keys and recognised text that were added or used
+    """
+    global _ocr_cache
+    merged = _read_ocr_cache()
+    for key, text in entries.items():
+        merged.pop(key, None)
+        merged[key] = text
+    if len(merged) > _OCR_CACHE_MAX_ENTRIES:
+        merged = dict(list(merged.items())[-_OCR_CACHE_MAX_ENTRIES:])
+    try:
+        _OCR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f"{_OCR_CACHE_PATH.name}.", suffix='.tmp',
+                                        dir=_OCR_CACHE_PATH.parent)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(merged, f, ensure_ascii=False)
+            os.replace(tmp_path, _OCR_CACHE_PATH)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"\nWarning: Could not save OCR cache: {e}")
+        return
+    _ocr_cache = merged
+
+
+@functools.lru_cache(maxsize=2)
+def _ocr_engine_id(use_tesserocr: bool) -> str:
+    """
+    Name and version of an OCR engine, for the OCR cache keys.
+
+    Text recognised by one engine or Tesseract version is not reused by
+    another. Tesseract runs with its default language and settings; an
+    option that changes them must be added here too.
+    """
+    engine = "tesserocr" if use_tesserocr else "pytesseract"
+    try:
+        if use_tesserocr:
+            version = tesserocr.tesseract_version().splitlines()[0]
+        else:
+            version = f"tesseract {pytesseract.get_tesseract_version()}"
+    except Exception:
+        version = "tesseract"
+    return f"{engine}/{version}"
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes straight to a file descriptor, bypassing Python's buffered I/O."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+# Mean font size is the one word-statistics kernel a compiled loop speeds up
+# at every page size; for largest_indices and spans_columns the NumPy
+# partition and ptp calls are as fast on typical pages and several times
+# faster on dense ones, so they are not compiled
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _mean_font_size_jit(font_sizes):
+        total = 0.0
+        count = 0
+        for size in font_sizes:
+            if size > 0:
+                total += size
+                count += 1
+        return total / count if count else 0.0
+
+    mean_font_size = _mean_font_size_jit
+else:
+    mean_font_size = _mean_font_size_np
+largest_indices = _largest_indices_np
+spans_columns = _spans_columns_np
+
+
+@dataclass(**_SLOTS)
 class WordInfo:
     """Information about a single word in the PDF."""
     text: str
@@ -83,10 +407,26 @@ class WordInfo:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Spelled out rather than asdict(), which walks and deep-copies the
+        # fields of every one of the (many) words
+        return {
+            'text': self.text,
+            'page': self.page,
+            'x0': self.x0,
+            'y0': self.y0,
+            'x1': self.x1,
+            'y1': self.y1,
+            'width': self.width,
+            'height': self.height,
+            'font_name': self.font_name,
+            'font_size': self.font_size,
+            'is_bold': self.is_bold,
+            'is_italic': self.is_italic,
+            'color': self.color
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ImageData:
     """Information about an image in the PDF."""
     page: int
@@ -99,24 +439,47 @@ class ImageData:
     x1: float
     y1: float
     format: str = "unknown"
-    size_bytes: int = 0
+    size_bytes: int = 0  # Size of the extracted image file; 0 if unknown
     dpi: Optional[Tuple[int, int]] = None
-    color_space: str = ""
+    color_space: str = ""  # Color space name from the image dictionary
     base64_data: Optional[str] = None
     file_path: Optional[str] = None
     ai_description: Optional[str] = None
     ocr_text: Optional[str] = None
 
+    @property
+    def area(self) -> int:
+        """Pixel count; derived from width and height, so it is not serialized."""
+        return self.width * self.height
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        data = asdict(self)
+        base64_data = self.base64_data
         # Optionally exclude base64 data to reduce file size
-        if self.base64_data and len(self.base64_data) > 1000:
-            data['base64_data'] = f"<{len(self.base64_data)} bytes>"
-        return data
+        if base64_data and len(base64_data) > 1000:
+            base64_data = f"<{len(base64_data)} bytes>"
+        return {
+            'page': self.page,
+            'index': self.index,
+            'name': self.name,
+            'width': self.width,
+            'height': self.height,
+            'x0': self.x0,
+            'y0': self.y0,
+            'x1': self.x1,
+            'y1': self.y1,
+            'format': self.format,
+            'size_bytes': self.size_bytes,
+            'dpi': self.dpi,
+            'color_space': self.color_space,
+            'base64_data': base64_data,
+            'file_path': self.file_path,
+            'ai_description': self.ai_description,
+            'ocr_text': self.ocr_text
+        }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PageData:
     """Information about a PDF page."""
     page_number: int
@@ -128,6 +491,115 @@ class PageData:
     words: List[WordInfo] = field(default_factory=list)
     images: List[ImageData] = field(default_factory=list)
     raw_text: str = ""
+    _font_sizes_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _x0_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _coords_np: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _text_lower: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _word_starts: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+
+    # The per-word column arrays below are read-only snapshots of ``words``.
+    # They are dropped whenever ``words`` is assigned or changes length; after
+    # editing WordInfo objects in place, call invalidate_columns().
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == 'words':
+            self.invalidate_columns()
+
+    def invalidate_columns(self) -> None:
+        """Drop the cached per-word arrays so they are rebuilt from ``words``."""
+        for cache in ('_font_sizes_np', '_x0_np', '_coords_np', '_text_lower', '_word_starts'):
+            object.__setattr__(self, cache, None)
+
+    @property
+    def font_sizes_np(self) -> np.ndarray:
+        """Font size of every word as a float32 array, built once and cached."""
+        if self._font_sizes_np is None or len(self._font_sizes_np) != len(self.words):
+            self._font_sizes_np = np.fromiter((w.font_size for w in self.words),
+                                              dtype=np.float32, count=len(self.words))
+        return self._font_sizes_np
+
+    @property
+    def x0_np(self) -> np.ndarray:
+        """Left coordinate of every word as a float32 array, built once and cached."""
+        if self._x0_np is None or len(self._x0_np) != len(self.words):
+            self._x0_np = np.fromiter((w.x0 for w in self.words),
+                                      dtype=np.float32, count=len(self.words))
+        return self._x0_np
+
+    @property
+    def coords_np(self) -> np.ndarray:
+        """
+        Bounding box of every word as an (N, 4) float32 array of x0, y0, x1, y1.
+
+        Built once and cached, like the other per-word column arrays, so
+        geometric checks can work on whole columns instead of WordInfo objects.
+        """
+        if self._coords_np is None or len(self._coords_np) != len(self.words):
+            self._coords_np = np.array([(w.x0, w.y0, w.x1, w.y1) for w in self.words],
+                                       dtype=np.float32).reshape(-1, 4)
+        return self._coords_np
+
+    def _load_words(self, texts: List[str], coords: np.ndarray,
+                    font_names: Optional[List[str]] = None,
+                    font_sizes: Optional[np.ndarray] = None) -> None:
+        """
+        Fill ``words`` from parallel arrays built in one pass by a backend.
+
+        Widths and heights are computed for the whole page at once and the
+        font size and x0 column caches, which the page checks read, are
+        seeded from the same buffers, so no per-word arithmetic happens in
+        Python; coords_np is left to be built on first use. Bold and italic
+        flags are derived from the font name.
+
+        Args:
+            texts: Word strings
+            coords: (N, 4) float64 array of x0, top, x1, bottom
+            font_names: Font name per word, if known
+            font_sizes: float64 array of font size per word, if known
+        """
+        coords = coords.reshape(-1, 4)
+        rows = np.hstack((coords, coords[:, 2:] - coords[:, :2])).tolist()
+        page = self.page_number
+
+        if font_names is None:
+            self.words = [WordInfo(text, page, *row) for text, row in zip(texts, rows)]
+            self._font_sizes_np = np.zeros(len(rows), dtype=np.float32)
+        else:
+            self.words = [WordInfo(text, page, *row, font_name, font_size, *_font_style(font_name))
+                          for text, row, font_name, font_size
+                          in zip(texts, rows, font_names, font_sizes.tolist())]
+            self._font_sizes_np = font_sizes.astype(np.float32)
+
+        self._x0_np = coords[:, 0].astype(np.float32)
+        self.word_count = len(self.words)
+
+    def find_words(self, pattern: "re.Pattern[str]") -> np.ndarray:
+        """
+        Find the words on this page that contain a match of a regex.
+
+        All words are joined into one lowercase string (built once, then
+        cached) and scanned in a single pass, so compile the pattern in
+        lowercase or with re.IGNORECASE.
+
+        Args:
+            pattern: Compiled regular expression to search for
+
+        Returns:
+            Sorted array of indices into ``words``, one per matching word
+        """
+        if self._word_starts is None or len(self._word_starts) != len(self.words):
+            texts = [w.text.lower() for w in self.words]
+            self._text_lower = "\n".join(texts)
+            ends = np.cumsum(np.fromiter((len(t) + 1 for t in texts),
+                                         dtype=np.int64, count=len(texts)))
+            self._word_starts = np.concatenate(([0], ends[:-1])) if len(ends) else ends
+
+        starts = np.fromiter((m.start() for m in pattern.finditer(self._text_lower)),
+                             dtype=np.int64)
+        if not starts.size:
+            return starts
+        return np.unique(np.searchsorted(self._word_starts, starts, side='right') - 1)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -164,6 +636,12 @@ class PDFExtraction:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        data = self._header_dict()
+        data['pages'] = [p.to_dict() for p in self.pages]
+        return data
+
+    def _header_dict(self) -> Dict[str, Any]:
+        """Document-level fields of to_dict(), without the pages."""
         return {
             'file_path': self.file_path,
             'file_size': self.file_size,
@@ -177,8 +655,7 @@ class PDFExtraction:
             'modification_date': self.modification_date,
             'extraction_date': self.extraction_date,
             'total_words': self.total_words,
-            'total_images': self.total_images,
-            'pages': [p.to_dict() for p in self.pages]
+            'total_images': self.total_images
         }
 
 
@@ -187,7 +664,9 @@ class PDFExtractor:
 
     def __init__(self, pdf_path: str, extract_images: bool = True,
                  images_dir: Optional[str] = None, use_ocr: bool = False,
-                 include_base64: bool = False, use_ai: bool = False):
+                 include_base64: bool = False, use_ai: bool = False,
+                 decode_pixels: bool = True, workers: int = 1,
+                 ocr_cache: bool = False):
         """
         Initialize the PDF extractor.
 
@@ -198,63 +677,311 @@ class PDFExtractor:
             use_ocr: Whether to use OCR on images
             include_base64: Include base64 encoded image data in output
             use_ai: Use AI for image description (requires AI integration)
+            decode_pixels: Decode image data; when False only image metadata
+                is collected, size_bytes is 0 unless the stream is stored
+                as a JPEG or JPEG 2000 file, and images_dir, include_base64
+                and use_ocr have no effect
+            workers: Number of processes to extract pages with; each
+                process handles one contiguous range of pages
+            ocr_cache: Reuse and store OCR results in the on-disk OCR cache;
+                also turned on by PDF_EXTRACTOR_OCR_CACHE=1
         """
         self.pdf_path = Path(pdf_path)
+        self._path_str = str(self.pdf_path)
         self.extract_images = extract_images
         self.images_dir = Path(images_dir) if images_dir else None
         self.use_ocr = use_ocr
         self.include_base64 = include_base64
         self.use_ai = use_ai
+        self.decode_pixels = decode_pixels
+        self.workers = max(1, workers)
+        self.ocr_cache = ocr_cache or os.environ.get('PDF_EXTRACTOR_OCR_CACHE') == '1'
+        self._write_pool: Optional[ThreadPoolExecutor] = None
+        self._pending_writes: "deque[Tuple[Future, str]]" = deque()
+        self._writes_submitted = 0
+        self._failed_writes: Set[str] = set()
+        self._image_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._image_cache_bytes = 0
+        self._saved_images: Dict[int, str] = {}
+        self._tess_api = None
+        # Cleared if tesserocr's API cannot be started, so OCR falls back
+        # to pytesseract (or is skipped) for the rest of the extraction
+        self._use_tesserocr = HAS_TESSEROCR
+        # OCR results not yet in the cache file; worker processes hand theirs
+        # to the parent, which is the only process that writes the file
+        self._ocr_results: Dict[str, str] = {}
+        self._is_worker = False
+        self._page_range: Optional[range] = None
+        self._num_pages: Optional[int] = None
 
         if self.images_dir:
             self.images_dir.mkdir(exist_ok=True)
 
-        if not self.pdf_path.exists():
-            raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        # One stat call both checks the file exists and records its size
+        try:
+            self._stat = os.stat(self._path_str)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PDF file not found: {pdf_path}") from None
 
-    def extract(self) -> PDFExtraction:
+    def extract(self, on_page: Optional[Callable[[PageData], None]] = None) -> PDFExtraction:
         """
         Extract all content from the PDF.
 
+        Args:
+            on_page: Called with each page as soon as it is extracted, so
+                callers can start processing pages before the rest of the
+                document is done
+
         Returns:
             PDFExtraction object containing all extracted data
         """
         print(f"Extracting content from: {self.pdf_path}")
 
-        # Initialize extraction object
+        # Initialize extraction object with document metadata
+        extraction = self.extract_metadata()
+
+        # Extract content page by page, keeping running totals
+        for page_data in self.iter_pages():
+            extraction.pages.append(page_data)
+            extraction.total_words += page_data.word_count
+            extraction.total_images += page_data.image_count
+            if on_page is not None:
+                on_page(page_data)
+
+        print(f"Extraction complete: {extraction.total_words} words, "
+              f"{extraction.total_images} images from {extraction.num_pages} pages")
+
+        return extraction
+
+    async def extract_async(self, executor: Optional[Executor] = None) -> PDFExtraction:
+        """
+        Extract all content without blocking the running event loop.
+
+        Args:
+            executor: Executor to run the extraction in; a ProcessPoolExecutor
+                lets several PDFs be parsed in parallel. Defaults to the event
+                loop's thread pool.
+
+        Returns:
+            PDFExtraction object containing all extracted data
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.extract)
+
+    def extract_metadata(self) -> PDFExtraction:
+        """
+        Read document metadata without extracting any page content.
+
+        Returns:
+            PDFExtraction object with metadata filled in and no pages
+        """
         extraction = PDFExtraction(
-            file_path=str(self.pdf_path),
-            file_size=self.pdf_path.stat().st_size,
+            file_path=self._path_str,
+            file_size=self._stat.st_size,
             num_pages=0
         )
-
-        # Extract metadata
         self._extract_metadata(extraction)
+        return extraction
+
+    def iter_pages(self) -> Iterator[PageData]:
+        """
+        Extract content one page at a time.
+
+        Pages are yielded as soon as they are processed, so callers that only
+        need aggregate results can discard each page and keep memory bounded
+        regardless of document size.
+
+        Saved image files are written by background threads. A page is
+        yielded once its files have been written (while the next page is
+        being extracted), and an image whose file could not be written has
+        file_path set to None.
+
+        With more than one worker, each process extracts a contiguous range
+        of pages and its pages are yielded once the whole range is done.
+
+        Returns:
+            Iterator over PageData for each page, in page order
+        """
+        if self.workers > 1:
+            return self._iter_parallel()
+        return self._iter_sequential()
+
+    def _iter_sequential(self) -> Iterator[PageData]:
+        """Extract pages in this process with the best available library."""
+        if self.images_dir and self.extract_images and self.decode_pixels:
+            self._write_pool = ThreadPoolExecutor(max_workers=_IMAGE_WRITERS,
+                                                  thread_name_prefix="pdf-image-writer")
 
-        # Extract content page by page
         if HAS_PDFPLUMBER and HAS_PYMUPDF:
-            self._extract_with_both_libraries(extraction)
+            pages = self._iter_with_both_libraries()
         elif HAS_PDFPLUMBER:
-            self._extract_with_pdfplumber(extraction)
+            pages = self._iter_with_pdfplumber()
         elif HAS_PYMUPDF:
-            self._extract_with_pymupdf(extraction)
+            pages = self._iter_with_pymupdf()
         else:
-            self._extract_with_pikepdf(extraction)
+            pages = self._iter_with_pikepdf()
 
-        # Calculate totals
-        extraction.total_words = sum(p.word_count for p in extraction.pages)
-        extraction.total_images = sum(p.image_count for p in extraction.pages)
+        try:
+            # A page with image writes still running is held back until the
+            # next one has been extracted, so the writes overlap that work and
+            # have finished (and any failures are known) by the time the page
+            # is handed out; any other page is handed out straight away
+            held, held_writes = None, 0
+            for page_data in pages:
+                if held is not None:
+                    yield self._settle_writes(held, held_writes)
+                    held = None
+                if self._pending_writes:
+                    held, held_writes = page_data, self._writes_submitted
+                else:
+                    yield self._settle_writes(page_data, self._writes_submitted)
+            if held is not None:
+                yield self._settle_writes(held, held_writes)
+        finally:
+            pages.close()
+            self._image_cache.clear()
+            self._image_cache_bytes = 0
+            self._saved_images.clear()
+            if self._tess_api is not None:
+                self._tess_api.End()
+                self._tess_api = None
+            if self._ocr_results and not self._is_worker:
+                _save_ocr_cache(self._ocr_results)
+                self._ocr_results = {}
+            if self._write_pool is not None:
+                self._wait_for_writes(self._writes_submitted)
+                self._write_pool.shutdown()
+                self._write_pool = None
+            self._failed_writes.clear()
+
+    def _iter_parallel(self) -> Iterator[PageData]:
+        """Extract contiguous page ranges in worker processes, yielding in order."""
+        # extract() has already read the page count with the metadata; only
+        # open the file here when iter_pages() is called on its own
+        num_pages = self._num_pages
+        if num_pages is None:
+            try:
+                with pikepdf.open(self._path_str) as pdf:
+                    num_pages = self._num_pages = len(pdf.pages)
+            except Exception as e:
+                print(f"Warning: Could not count pages for parallel extraction: {e}")
+                num_pages = 0
+
+        workers = min(self.workers, num_pages)
+        if workers < 2:
+            # Not worth a pool; extract in this process instead
+            yield from self._iter_sequential()
+            return
+
+        print(f"Extracting {num_pages} pages with {workers} worker processes...")
+
+        # PyMuPDF and pdfplumber documents cannot be pickled, so every worker
+        # reopens the file from the constructor options and returns PageData
+        options = {
+            'pdf_path': self._path_str,
+            'extract_images': self.extract_images,
+            'images_dir': str(self.images_dir) if self.images_dir else None,
+            'use_ocr': self.use_ocr,
+            'include_base64': self.include_base64,
+            'use_ai': self.use_ai,
+            'decode_pixels': self.decode_pixels,
+            'ocr_cache': self.ocr_cache,
+        }
+        step = -(-num_pages // workers)
+        ranges = [range(start, min(start + step, num_pages))
+                  for start in range(0, num_pages, step)]
+
+        # Tesseract multithreads each recognition; with several OCR processes
+        # that only oversubscribes the cores
+        initializer = _limit_ocr_threads if self.use_ocr else None
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=initializer)
+        futures: List[Future] = []
+        try:
+            futures = [executor.submit(_extract_page_range, options, page_range)
+                       for page_range in ranges]
+            for future in futures:
+                pages, ocr_results = future.result()
+                self._ocr_results.update(ocr_results)
+                yield from pages
+        finally:
+            if self._ocr_results:
+                _save_ocr_cache(self._ocr_results)
+                self._ocr_results = {}
+            # If the caller stops iterating early, drop the ranges that have
+            # not started instead of waiting for every one to finish
+            # (cancel_futures is only accepted from Python 3.9)
+            if sys.version_info >= (3, 9):
+                executor.shutdown(wait=False, cancel_futures=True)
+            else:
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
 
-        print(f"Extraction complete: {extraction.total_words} words, "
-              f"{extraction.total_images} images from {extraction.num_pages} pages")
+    def _page_indices(self, num_pages: int) -> range:
+        """Return the zero-based page indices this extractor should process."""
+        if self._page_range is None:
+            return range(num_pages)
+        return range(max(self._page_range.start, 0), min(self._page_range.stop, num_pages))
 
-        return extraction
+    def _save_image(self, path: Path, data: bytes) -> None:
+        """
+        Write an extracted image, on the writer threads when they are running.
+
+        At most _IMAGE_QUEUE_SIZE writes are left outstanding; beyond that
+        extraction waits for the oldest one, so a slow disk cannot make
+        unwritten image data pile up in memory.
+        """
+        self._writes_submitted += 1
+        if self._write_pool is None:
+            if not self._write_image(path, data):
+                self._failed_writes.add(str(path))
+            return
+
+        if len(self._pending_writes) >= _IMAGE_QUEUE_SIZE:
+            self._wait_for_writes(self._writes_submitted - _IMAGE_QUEUE_SIZE)
+        future = self._write_pool.submit(self._write_image, path, data)
+        self._pending_writes.append((future, str(path)))
+
+    def _wait_for_writes(self, count: int) -> None:
+        """Wait until the first count submitted writes have finished."""
+        while self._pending_writes and self._writes_submitted - len(self._pending_writes) < count:
+            future, path = self._pending_writes.popleft()
+            if not future.result():
+                self._failed_writes.add(path)
+
+    def _settle_writes(self, page_data: PageData, writes: int) -> PageData:
+        """
+        Wait for a page's image writes and unset file_path where one failed.
+
+        Args:
+            page_data: Page to hand out
+            writes: Number of writes submitted by the end of that page
+
+        Returns:
+            The same page
+        """
+        self._wait_for_writes(writes)
+        if self._failed_writes:
+            for image_data in page_data.images:
+                if image_data.file_path in self._failed_writes:
+                    image_data.file_path = None
+        return page_data
+
+    @staticmethod
+    def _write_image(path: Path, data: bytes) -> bool:
+        """Write one image file, reporting rather than raising on failure."""
+        try:
+            _write_file(path, data)
+        except OSError as e:
+            print(f"\nWarning: Could not save image {path}: {e}")
+            return False
+        return True
 
     def _extract_metadata(self, extraction: PDFExtraction) -> None:
         """Extract PDF metadata using pikepdf."""
         try:
-            with pikepdf.open(self.pdf_path) as pdf:
-                extraction.num_pages = len(pdf.pages)
+            with pikepdf.open(self._path_str) as pdf:
+                extraction.num_pages = self._num_pages = len(pdf.pages)
 
                 if pdf.docinfo:
                     info = pdf.docinfo
@@ -272,7 +999,32 @@ class PDFExtractor:
         except Exception as e:
             print(f"Warning: Could not extract metadata: {e}")
 
-    def _extract_with_both_libraries(self, extraction: PDFExtraction) -> None:
+    @contextmanager
+    def _open_pdfplumber(self) -> Iterator[Any]:
+        """
+        Open the PDF with pdfplumber, memory-mapping large files.
+
+        pdfminer parses in pure Python through many small seeks and reads;
+        serving them from a read-only mapping avoids a syscall and buffer
+        copy for each one.
+        """
+        if self._stat.st_size <= _MMAP_THRESHOLD:
+            with pdfplumber.open(self._path_str) as pdf:
+                yield pdf
+            return
+
+        with open(self._path_str, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if hasattr(mapped, 'madvise'):
+                # Object lookups jump around the file via the xref table
+                mapped.madvise(mmap.MADV_RANDOM)
+            with pdfplumber.open(mapped) as pdf:
+                yield pdf
+        finally:
+            mapped.close()
+
+    def _iter_with_both_libraries(self) -> Iterator[PageData]:
         """
         Extract using both pdfplumber (text) and PyMuPDF (images).
         This provides the most comprehensive extraction.
@@ -280,10 +1032,17 @@ class PDFExtractor:
         print("Using pdfplumber for text and PyMuPDF for images...")
 
         # Open with both libraries
-        pdf_plumber = pdfplumber.open(str(self.pdf_path))
-        pdf_fitz = fitz.open(str(self.pdf_path))
+        with self._open_pdfplumber() as pdf_plumber:
+            pdf_fitz = fitz.open(self._path_str)
+            try:
+                yield from self._iter_both_library_pages(pdf_plumber, pdf_fitz)
+            finally:
+                pdf_fitz.close()
+        print()  # New line after progress
 
-        for page_num in range(len(pdf_plumber.pages)):
+    def _iter_both_library_pages(self, pdf_plumber, pdf_fitz) -> Iterator[PageData]:
+        """Yield pages from already-open pdfplumber and PyMuPDF documents."""
+        for page_num in self._page_indices(len(pdf_plumber.pages)):
             print(f"Processing page {page_num + 1}/{len(pdf_plumber.pages)}...", end='\r')
 
             plumber_page = pdf_plumber.pages[page_num]
@@ -300,24 +1059,7 @@ class PDFExtractor:
             )
 
             # Extract words with pdfplumber
-            words = plumber_page.extract_words()
-            for word_data in words:
-                word = WordInfo(
-                    text=word_data['text'],
-                    page=page_num + 1,
-                    x0=float(word_data['x0']),
-                    y0=float(word_data['top']),
-                    x1=float(word_data['x1']),
-                    y1=float(word_data['bottom']),
-                    width=float(word_data['x1'] - word_data['x0']),
-                    height=float(word_data['bottom'] - word_data['top']),
-                    font_name=word_data.get('fontname', ''),
-                    font_size=float(word_data.get('height', 0))
-                )
-                page_data.words.append(word)
-
-            page_data.word_count = len(page_data.words)
-            page_data.raw_text = plumber_page.extract_text() or ""
+            self._load_plumber_text(page_data, plumber_page)
 
             # Extract images with PyMuPDF
             if self.extract_images:
@@ -325,20 +1067,73 @@ class PDFExtractor:
                 page_data.images = images
                 page_data.image_count = len(images)
 
-            extraction.pages.append(page_data)
+            yield page_data
+
+    @classmethod
+    def _load_plumber_text(cls, page_data: PageData, plumber_page) -> None:
+        """Fill a page's words and raw text with pdfplumber, skipping pages without text."""
+        if not cls._may_have_text(plumber_page):
+            cls._load_plumber_words(page_data, [])
+            return
+
+        # Plain extract_words() drops the per-character font; keep each word's
+        # characters and take it from the first one (extra_attrs would also
+        # split a word wherever the font changes)
+        words = plumber_page.extract_words(return_chars=True)
+        cls._load_plumber_words(page_data, words)
+
+        # Lay the words out as text rather than have extract_text() redo the
+        # word grouping from the characters
+        page_data.raw_text = _text_from_words(
+            [w['text'] for w in words],
+            np.array([w['top'] for w in words], dtype=np.float64),
+            np.array([w['x0'] for w in words], dtype=np.float64)
+        )
 
-        pdf_plumber.close()
-        pdf_fitz.close()
-        print()  # New line after progress
+    @staticmethod
+    def _may_have_text(plumber_page) -> bool:
+        """
+        Return False only when a pdfplumber page certainly shows no text.
+
+        Text can only be drawn inside a BT ... ET block, either in the page's
+        own content streams or in a Form XObject the page paints. A scanned
+        page is usually a single image drawn without either, and spotting
+        that is a byte search, where extract_words() would run pdfminer's
+        full layout analysis for nothing.
+        """
+        try:
+            page_obj = plumber_page.page_obj
+            xobjects = resolve1(page_obj.resources.get('XObject')) if page_obj.resources else None
+            for xobject in (xobjects or {}).values():
+                if getattr(resolve1(xobject).get('Subtype'), 'name', None) == 'Form':
+                    return True
+            return any(b'BT' in resolve1(stream).get_data() for stream in page_obj.contents)
+        except Exception:
+            # Anything unexpected: let pdfplumber decide
+            return True
+
+    @staticmethod
+    def _load_plumber_words(page_data: PageData, words: List[Dict[str, Any]]) -> None:
+        """Fill a page from pdfplumber's extract_words(return_chars=True) output."""
+        first_chars = [w['chars'][0] if w.get('chars') else {} for w in words]
+        page_data._load_words(
+            [w['text'] for w in words],
+            np.array([(w['x0'], w['top'], w['x1'], w['bottom']) for w in words],
+                     dtype=np.float64),
+            font_names=[c.get('fontname', '') for c in first_chars],
+            font_sizes=np.array([c.get('size', w['bottom'] - w['top'])
+                                 for c, w in zip(first_chars, words)], dtype=np.float64)
+        )
 
-    def _extract_with_pdfplumber(self, extraction: PDFExtraction) -> None:
+    def _iter_with_pdfplumber(self) -> Iterator[PageData]:
         """Extract using pdfplumber only."""
         print("Using pdfplumber for extraction...")
 
-        with pdfplumber.open(str(self.pdf_path)) as pdf:
-            for page_num, page in enumerate(pdf.pages):
+        with self._open_pdfplumber() as pdf:
+            for page_num in self._page_indices(len(pdf.pages)):
                 print(f"Processing page {page_num + 1}/{len(pdf.pages)}...", end='\r')
 
+                page = pdf.pages[page_num]
                 page_data = PageData(
                     page_number=page_num + 1,
                     width=float(page.width),
@@ -349,36 +1144,27 @@ class PDFExtractor:
                 )
 
                 # Extract words
-                words = page.extract_words()
-                for word_data in words:
-                    word = WordInfo(
-                        text=word_data['text'],
-                        page=page_num + 1,
-                        x0=float(word_data['x0']),
-                        y0=float(word_data['top']),
-                        x1=float(word_data['x1']),
-                        y1=float(word_data['bottom']),
-                        width=float(word_data['x1'] - word_data['x0']),
-                        height=float(word_data['bottom'] - word_data['top']),
-                        font_name=word_data.get('fontname', ''),
-                        font_size=float(word_data.get('height', 0))
-                    )
-                    page_data.words.append(word)
-
-                page_data.word_count = len(page_data.words)
-                page_data.raw_text = page.extract_text() or ""
-
-                extraction.pages.append(page_data)
+                self._load_plumber_text(page_data, page)
+
+                yield page_data
 
         print()  # New line after progress
 
-    def _extract_with_pymupdf(self, extraction: PDFExtraction) -> None:
+    def _iter_with_pymupdf(self) -> Iterator[PageData]:
         """Extract using PyMuPDF only."""
         print("Using PyMuPDF for extraction...")
 
-        doc = fitz.open(str(self.pdf_path))
+        doc = fitz.open(self._path_str)
 
-        for page_num in range(len(doc)):
+        try:
+            yield from self._iter_pymupdf_pages(doc)
+        finally:
+            doc.close()
+        print()  # New line after progress
+
+    def _iter_pymupdf_pages(self, doc) -> Iterator[PageData]:
+        """Yield pages from an already-open PyMuPDF document."""
+        for page_num in self._page_indices(len(doc)):
             print(f"Processing page {page_num + 1}/{len(doc)}...", end='\r')
 
             page = doc[page_num]
@@ -392,23 +1178,16 @@ class PDFExtractor:
                 image_count=0
             )
 
-            # Extract words
-            words = page.get_text("words")  # Returns list of (x0, y0, x1, y1, "word", block_no, line_no, word_no)
-            for word_tuple in words:
-                word = WordInfo(
-                    text=word_tuple[4],
-                    page=page_num + 1,
-                    x0=float(word_tuple[0]),
-                    y0=float(word_tuple[1]),
-                    x1=float(word_tuple[2]),
-                    y1=float(word_tuple[3]),
-                    width=float(word_tuple[2] - word_tuple[0]),
-                    height=float(word_tuple[3] - word_tuple[1])
-                )
-                page_data.words.append(word)
+            # Parse the page layout once and read both words and text from it;
+            # get_textpage() defaults to no flags, so pass the ones get_text() uses
+            textpage = page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)
 
-            page_data.word_count = len(page_data.words)
-            page_data.raw_text = page.get_text()
+            # Extract words
+            words = page.get_text("words", textpage=textpage)  # Returns list of (x0, y0, x1, y1, "word", block_no, line_no, word_no)
+            coords, texts = _build_word_arrays(words)
+            font_names, font_sizes = _word_fonts(words, page.get_text("dict", textpage=textpage))
+            page_data._load_words(texts, coords, font_names, font_sizes)
+            page_data.raw_text = page.get_text(textpage=textpage)
 
             # Extract images
             if self.extract_images:
@@ -416,19 +1195,17 @@ class PDFExtractor:
                 page_data.images = images
                 page_data.image_count = len(images)
 
-            extraction.pages.append(page_data)
-
-        doc.close()
-        print()  # New line after progress
+            yield page_data
 
-    def _extract_with_pikepdf(self, extraction: PDFExtraction) -> None:
+    def _iter_with_pikepdf(self) -> Iterator[PageData]:
         """Extract using pikepdf only (fallback)."""
         print("Using pikepdf for extraction (limited functionality)...")
 
-        with pikepdf.open(self.pdf_path) as pdf:
-            for page_num, page in enumerate(pdf.pages):
+        with pikepdf.open(self._path_str) as pdf:
+            for page_num in self._page_indices(len(pdf.pages)):
                 print(f"Processing page {page_num + 1}/{len(pdf.pages)}...", end='\r')
 
+                page = pdf.pages[page_num]
                 page_data = PageData(
                     page_number=page_num + 1,
                     width=float(page.mediabox[2] - page.mediabox[0]),
@@ -445,7 +1222,7 @@ class PDFExtractor:
                 except Exception as e:
                     page_data.raw_text = f"Error extracting text: {e}"
 
-                extraction.pages.append(page_data)
+                yield page_data
 
         print()
         print("Warning: Limited extraction - install pdfplumber or PyMuPDF for better results")
@@ -453,12 +1230,13 @@ class PDFExtractor:
     def _extract_images_pymupdf(self, page, page_num: int) -> List[ImageData]:
         """Extract images from a PyMuPDF page."""
         images = []
+        ocr_pending = []
+        ocr_digests = []
         image_list = page.get_images()
 
         for img_index, img in enumerate(image_list):
             try:
                 xref = img[0]
-                base_image = page.parent.extract_image(xref)
 
                 # Get image position on page
                 image_rects = page.get_image_rects(xref)
@@ -468,6 +1246,26 @@ class PDFExtractor:
                 else:
                     x0 = y0 = x1 = y1 = 0
 
+                if not self.decode_pixels:
+                    # Metadata only: use what the image dictionary declares
+                    # and leave the stream undecoded. The file size is only
+                    # known when the stream would be extracted unchanged.
+                    images.append(ImageData(
+                        page=page_num,
+                        index=img_index,
+                        name=f"page{page_num}_img{img_index}",
+                        width=img[2],
+                        height=img[3],
+                        x0=x0, y0=y0, x1=x1, y1=y1,
+                        format=_FILTER_FORMATS.get(img[8], 'png'),
+                        size_bytes=(self._stream_length(page.parent, xref)
+                                    if img[8] in _PASSTHROUGH_FILTERS else 0),
+                        color_space=img[5]
+                    ))
+                    continue
+
+                base_image = self._load_image(page.parent, xref)
+
                 image_data = ImageData(
                     page=page_num,
                     index=img_index,
@@ -477,89 +1275,402 @@ class PDFExtractor:
                     x0=x0, y0=y0, x1=x1, y1=y1,
                     format=base_image['ext'],
                     size_bytes=len(base_image['image']),
-                    color_space=base_image.get('colorspace', '')
+                    color_space=img[5]
                 )
 
-                # Save image to file if requested
+                # Save image to file if requested; an image shown on several
+                # pages is written once and every occurrence points at that file
                 if self.images_dir:
-                    img_path = self.images_dir / f"{image_data.name}.{image_data.format}"
-                    img_path.write_bytes(base_image['image'])
-                    image_data.file_path = str(img_path)
+                    saved_path = self._saved_images.get(xref)
+                    if saved_path is None:
+                        img_path = self.images_dir / f"{image_data.name}.{image_data.format}"
+                        self._save_image(img_path, base_image['image'])
+                        saved_path = self._saved_images[xref] = str(img_path)
+                    image_data.file_path = saved_path
 
                 # Include base64 if requested
                 if self.include_base64:
-                    image_data.base64_data = base64.b64encode(base_image['image']).decode('utf-8')
-
-                # OCR if requested
-                if self.use_ocr and HAS_TESSERACT and HAS_PIL:
-                    try:
-                        img_bytes = io.BytesIO(base_image['image'])
-                        pil_img = Image.open(img_bytes)
-                        ocr_text = pytesseract.image_to_string(pil_img)
-                        image_data.ocr_text = ocr_text.strip()
-                    except Exception as e:
-                        print(f"\nWarning: OCR failed for image {image_data.name}: {e}")
+                    image_data.base64_data = binascii.b2a_base64(base_image['image'], newline=False).decode('ascii')
+
+                # OCR if requested; images seen before (in any run) take their
+                # text from the cache and the rest are recognised together below
+                if self.use_ocr and (self._use_tesserocr or HAS_TESSERACT) and HAS_PIL:
+                    digest = cached_text = None
+                    if self.ocr_cache:
+                        digest = hashlib.sha1(base_image['image']).hexdigest()
+                        cached_text = _get_ocr_cache().get(self._ocr_cache_key(digest))
+                    if cached_text is not None:
+                        image_data.ocr_text = cached_text
+                        # Saved again so the entry counts as recently used
+                        self._ocr_results[self._ocr_cache_key(digest)] = cached_text
+                    else:
+                        try:
+                            img_bytes = io.BytesIO(base_image['image'])
+                            ocr_pending.append((image_data, Image.open(img_bytes)))
+                            ocr_digests.append(digest)
+                        except Exception as e:
+                            print(f"\nWarning: OCR failed for image {image_data.name}: {e}")
 
                 images.append(image_data)
 
             except Exception as e:
                 print(f"\nWarning: Could not extract image {img_index} from page {page_num}: {e}")
 
+        if ocr_pending:
+            self._ocr_images(ocr_pending)
+            if self.ocr_cache:
+                # Keyed after recognition, by the engine that actually ran
+                cache = _get_ocr_cache()
+                for (image_data, _), digest in zip(ocr_pending, ocr_digests):
+                    if image_data.ocr_text is not None:
+                        key = self._ocr_cache_key(digest)
+                        cache[key] = self._ocr_results[key] = image_data.ocr_text
+
         return images
 
-    def save_to_json(self, extraction: PDFExtraction, output_path: str) -> None:
-        """Save extraction data to JSON file."""
+    def _ocr_cache_key(self, digest: str) -> str:
+        """OCR cache key for an image's SHA-1 digest under the engine in use."""
+        return f"{_ocr_engine_id(self._use_tesserocr)}:{digest}"
+
+    def _ocr_images(self, pending: List[Tuple[ImageData, Any]]) -> None:
+        """
+        Fill in ocr_text for a page's images with as few Tesseract runs as possible.
+
+        With tesserocr installed, one in-process Tesseract API is loaded per
+        extraction and reused for every image; if it cannot be started,
+        pytesseract is used instead, or OCR is skipped. Otherwise each pytesseract
+        call starts a Tesseract process and loads its language model, which
+        usually costs more than recognising a small image, so images are
+        stacked vertically onto one canvas, recognised in a single
+        image_to_data call, and each recognised word is assigned back to
+        the image whose band it falls in.
+
+        Args:
+            pending: (ImageData, PIL image) pairs to recognise
+        """
+        if self._use_tesserocr and self._tess_api is None:
+            try:
+                self._tess_api = tesserocr.PyTessBaseAPI()
+            except Exception as e:
+                # Missing or broken tessdata, for example
+                self._use_tesserocr = False
+                fallback = "using pytesseract" if HAS_TESSERACT else "skipping OCR"
+                print(f"\nWarning: Could not start tesserocr ({e}); {fallback}")
+
+        if self._use_tesserocr:
+            for image_data, pil_img in pending:
+                try:
+                    self._tess_api.SetImage(pil_img)
+                    image_data.ocr_text = self._tess_api.GetUTF8Text().strip()
+                except Exception as e:
+                    print(f"\nWarning: OCR failed for image {image_data.name}: {e}")
+            return
+        if not HAS_TESSERACT:
+            return
+
+        batch: List[Tuple[ImageData, Any]] = []
+        height = 0
+        for item in pending:
+            item_height = item[1].height
+            if batch and height + _OCR_GAP + item_height > _OCR_MAX_HEIGHT:
+                self._ocr_batch(batch)
+                batch, height = [], 0
+            height += item_height + (_OCR_GAP if batch else 0)
+            batch.append(item)
+        self._ocr_batch(batch)
+
+    @staticmethod
+    def _ocr_batch(batch: List[Tuple[ImageData, Any]]) -> None:
+        """Recognise one stack of images and split the text between them."""
+        if len(batch) == 1:
+            image_data, pil_img = batch[0]
+            try:
+                image_data.ocr_text = pytesseract.image_to_string(pil_img).strip()
+            except Exception as e:
+                print(f"\nWarning: OCR failed for image {image_data.name}: {e}")
+            return
+
+        try:
+            grays = [pil_img.convert('L') for _, pil_img in batch]
+            offsets = []
+            y = 0
+            for gray in grays:
+                offsets.append(y)
+                y += gray.height + _OCR_GAP
+            canvas = Image.new('L', (max(g.width for g in grays), y - _OCR_GAP), 255)
+            for gray, offset in zip(grays, offsets):
+                canvas.paste(gray, (0, offset))
+
+            data = pytesseract.image_to_data(canvas, output_type=pytesseract.Output.DICT)
+        except Exception as e:
+            names = ", ".join(image_data.name for image_data, _ in batch)
+            print(f"\nWarning: OCR failed for images {names}: {e}")
+            return
+
+        # Rebuild each image's text line by line from the word boxes, which
+        # Tesseract reports in reading order
+        lines: List[Dict[Tuple[int, int, int], List[str]]] = [{} for _ in batch]
+        centers = np.asarray(data['top']) + np.asarray(data['height']) // 2
+        owners = np.searchsorted(offsets, centers, side='right') - 1
+        for i, text in enumerate(data['text']):
+            text = text.strip()
+            if text:
+                key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+                lines[owners[i]].setdefault(key, []).append(text)
+
+        for (image_data, _), image_lines in zip(batch, lines):
+            image_data.ocr_text = "\n".join(" ".join(words) for words in image_lines.values())
+
+    def _load_image(self, doc, xref: int) -> Dict[str, Any]:
+        """
+        Return doc.extract_image(xref), reusing recently decoded images.
+
+        Logos and page backgrounds are usually one image object referenced
+        from every page. Decoded results are kept in a least-recently-used
+        cache bounded by total image bytes, so memory stays flat however
+        many distinct images the document has.
+        """
+        cache = self._image_cache
+        base_image = cache.get(xref)
+        if base_image is not None:
+            cache.move_to_end(xref)
+            return base_image
+
+        base_image = doc.extract_image(xref)
+        cache[xref] = base_image
+        self._image_cache_bytes += len(base_image['image'])
+        while self._image_cache_bytes > _IMAGE_CACHE_BYTES and len(cache) > 1:
+            _, evicted = cache.popitem(last=False)
+            self._image_cache_bytes -= len(evicted['image'])
+        return base_image
+
+    @staticmethod
+    def _stream_length(doc, xref: int) -> int:
+        """Return the encoded size of a stream without decoding it."""
+        kind, value = doc.xref_get_key(xref, "Length")
+        if kind == 'int':
+            return int(value)
+        return len(doc.xref_stream_raw(xref))
+
+    def extract_to_file(self, output_path: str, output_format: str = 'json') -> PDFExtraction:
+        """
+        Extract the PDF and write the results straight to a file.
+
+        Each page is written as soon as it has been extracted and is then
+        dropped, so memory use stays flat however many pages the document
+        has. Document totals are only known once the last page is done, so
+        they come after the pages: following "pages" in JSON, and in a
+        closing summary in the text report.
+
+        The 'ndjson' format writes compact JSON, one object per line: a
+        "document" record with the metadata, a "page" record per page, and
+        a closing "totals" record.
+
+        Args:
+            output_path: File to write
+            output_format: 'json', 'ndjson' or 'text'
+
+        Returns:
+            PDFExtraction with metadata and totals filled in and no pages
+        """
+        print(f"Extracting content from: {self.pdf_path}")
         output_path = Path(output_path)
+        extraction = self.extract_metadata()
+
+        def counted(pages: Iterator[PageData]) -> Iterator[PageData]:
+            for page in pages:
+                extraction.total_words += page.word_count
+                extraction.total_images += page.image_count
+                yield page
+
+        if output_format == 'json':
+            dumps = self._json_dumps()
+            header = extraction._header_dict()
+            del header['total_words'], header['total_images']
+
+            with output_path.open('wb', buffering=_WRITE_BUFFER) as f:
+                f.write(dumps(header)[:-2])
+                f.write(b',\n  ')
+                self._write_json_pages(f, dumps, counted(self.iter_pages()))
+                f.write(b',\n  ')
+                # Only the key/value lines of the totals object
+                f.write(dumps({'total_words': extraction.total_words,
+                               'total_images': extraction.total_images})[4:])
+        elif output_format == 'ndjson':
+            dumps = self._json_dumps(compact=True)
+            header = extraction._header_dict()
+            del header['total_words'], header['total_images']
+
+            with output_path.open('wb', buffering=_WRITE_BUFFER) as f:
+                f.write(dumps({'type': 'document', **header}) + b'\n')
+                for page in counted(self.iter_pages()):
+                    f.write(dumps({'type': 'page', **page.to_dict()}) + b'\n')
+                f.write(dumps({'type': 'totals',
+                               'total_words': extraction.total_words,
+                               'total_images': extraction.total_images}) + b'\n')
+        else:
+            with output_path.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+                f.write("".join(self._text_header_parts(extraction, totals=False)))
+                for page in counted(self.iter_pages()):
+                    f.write("".join(self._text_page_parts(page)))
+                f.write(f"Total Words: {extraction.total_words}\n"
+                        f"Total Images: {extraction.total_images}\n")
+
+        print(f"Extraction complete: {extraction.total_words} words, "
+              f"{extraction.total_images} images from {extraction.num_pages} pages")
+        print(f"Results saved to: {output_path}")
+
+        return extraction
 
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(extraction.to_dict(), f, indent=2, ensure_ascii=False)
+    def save_to_json(self, extraction: PDFExtraction, output_path: str,
+                     quiet: bool = False) -> None:
+        """
+        Save extraction data to JSON file.
 
-        print(f"Extraction data saved to: {output_path}")
+        Pages are serialized and written one at a time, so the nested dicts
+        for the whole document never exist in memory at once. The layout is
+        that of extraction.to_dict() dumped with an indent of 2; see
+        _json_dumps() for how orjson's number formatting differs.
 
-    def save_to_text(self, extraction: PDFExtraction, output_path: str) -> None:
-        """Save extraction data to human-readable text file."""
+        Args:
+            extraction: Extraction to save
+            output_path: File to write
+            quiet: Do not print where the file was saved
+        """
         output_path = Path(output_path)
+        dumps = self._json_dumps()
+
+        with output_path.open('wb', buffering=_WRITE_BUFFER) as f:
+            # Header object without its closing brace, then the pages array
+            f.write(dumps(extraction._header_dict())[:-2])
+            f.write(b',\n  ')
+            self._write_json_pages(f, dumps, extraction.pages)
+            f.write(b'\n}')
+
+        if not quiet:
+            print(f"Extraction data saved to: {output_path}")
+
+    @staticmethod
+    def _json_dumps(compact: bool = False) -> Callable[[Any], bytes]:
+        """
+        Return a function serializing to JSON bytes, using orjson if available.
 
-        with output_path.open('w', encoding='utf-8') as f:
-            f.write(f"PDF Extraction Report\n")
-            f.write(f"=" * 80 + "\n\n")
-            f.write(f"File: {extraction.file_path}\n")
-            f.write(f"Pages: {extraction.num_pages}\n")
-            f.write(f"Total Words: {extraction.total_words}\n")
-            f.write(f"Total Images: {extraction.total_images}\n")
-            f.write(f"Extraction Date: {extraction.extraction_date}\n\n")
+        Output is indented by 2 spaces, or has no whitespace at all when
+        compact is set.
 
-            if extraction.title:
-                f.write(f"Title: {extraction.title}\n")
-            if extraction.author:
-                f.write(f"Author: {extraction.author}\n")
+        orjson is not byte-compatible with the json module: it writes floats
+        in their shortest form (1e-7 and 1e17 rather than 1e-07 and 1e+17)
+        and NaN and infinities as null, so the file stays valid JSON. The
+        json fallback writes NaN and Infinity literals, as json.dump does.
+        NumPy scalars and arrays are serialized natively by orjson only.
+        """
+        if HAS_ORJSON:
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+
+            def dumps(obj: Any) -> bytes:
+                return orjson.dumps(obj, option=option)
+        else:
+            json_options = {'separators': (',', ':')} if compact else {'indent': 2}
+
+            def dumps(obj: Any) -> bytes:
+                return json.dumps(obj, ensure_ascii=False, **json_options).encode('utf-8')
+        return dumps
+
+    @staticmethod
+    def _write_json_pages(f: BinaryIO, dumps: Callable[[Any], bytes],
+                          pages: Iterable[PageData]) -> None:
+        """Write the "pages" member of the top-level object, one page at a time."""
+        f.write(b'"pages": [')
+        separator = b'\n    '
+        for page in pages:
+            # Pages sit two levels deep, so indent each line by 4 spaces
+            f.write(separator)
+            f.write(dumps(page.to_dict()).replace(b'\n', b'\n    '))
+            separator = b',\n    '
+        f.write(b']' if separator == b'\n    ' else b'\n  ]')
 
-            f.write("\n" + "=" * 80 + "\n\n")
+    def save_to_text(self, extraction: PDFExtraction, output_path: str) -> None:
+        """Save extraction data to human-readable text file."""
+        output_path = Path(output_path)
 
+        # One joined write per page into a large buffer, without holding the
+        # whole report in memory
+        with output_path.open('w', encoding='utf-8', buffering=_WRITE_BUFFER) as f:
+            f.write("".join(self._text_header_parts(extraction)))
             for page in extraction.pages:
-                f.write(f"PAGE {page.page_number}\n")
-                f.write(f"-" * 80 + "\n")
-                f.write(f"Dimensions: {page.width} x {page.height}\n")
-                f.write(f"Words: {page.word_count}\n")
-                f.write(f"Images: {page.image_count}\n\n")
-
-                if page.raw_text:
-                    f.write("TEXT CONTENT:\n")
-                    f.write(page.raw_text)
-                    f.write("\n\n")
-
-                if page.images:
-                    f.write(f"IMAGES ({len(page.images)}):\n")
-                    for img in page.images:
-                        f.write(f"  - {img.name}: {img.width}x{img.height} ({img.format})\n")
-                        if img.ocr_text:
-                            f.write(f"    OCR: {img.ocr_text[:100]}...\n")
-                    f.write("\n")
-
-                f.write("\n" + "=" * 80 + "\n\n")
+                f.write("".join(self._text_page_parts(page)))
 
         print(f"Text report saved to: {output_path}")
 
+    @staticmethod
+    def _text_header_parts(extraction: PDFExtraction, totals: bool = True) -> List[str]:
+        """Return the document section of the text report."""
+        parts = []
+        parts.append("PDF Extraction Report\n")
+        parts.append("=" * 80 + "\n\n")
+        parts.append(f"File: {extraction.file_path}\n")
+        parts.append(f"Pages: {extraction.num_pages}\n")
+        if totals:
+            parts.append(f"Total Words: {extraction.total_words}\n")
+            parts.append(f"Total Images: {extraction.total_images}\n")
+        parts.append(f"Extraction Date: {extraction.extraction_date}\n\n")
+
+        if extraction.title:
+            parts.append(f"Title: {extraction.title}\n")
+        if extraction.author:
+            parts.append(f"Author: {extraction.author}\n")
+
+        parts.append("\n" + "=" * 80 + "\n\n")
+        return parts
+
+    @staticmethod
+    def _text_page_parts(page: PageData) -> List[str]:
+        """Return one page's section of the text report."""
+        parts = []
+        parts.append(f"PAGE {page.page_number}\n")
+        parts.append("-" * 80 + "\n")
+        parts.append(f"Dimensions: {page.width} x {page.height}\n")
+        parts.append(f"Words: {page.word_count}\n")
+        parts.append(f"Images: {page.image_count}\n\n")
+
+        if page.raw_text:
+            parts.append("TEXT CONTENT:\n")
+            parts.append(page.raw_text)
+            parts.append("\n\n")
+
+        if page.images:
+            parts.append(f"IMAGES ({len(page.images)}):\n")
+            for img in page.images:
+                parts.append(f"  - {img.name}: {img.width}x{img.height} ({img.format})\n")
+                if img.ocr_text:
+                    parts.append(f"    OCR: {img.ocr_text[:100]}...\n")
+            parts.append("\n")
+
+        parts.append("\n" + "=" * 80 + "\n\n")
+        return parts
+
+
+def _limit_ocr_threads() -> None:
+    """Run Tesseract single-threaded in a page worker process."""
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+
+def _extract_page_range(options: Dict[str, Any],
+                        page_range: range) -> Tuple[List[PageData], Dict[str, str]]:
+    """
+    Extract one contiguous range of pages (runs in a worker process).
+
+    Returns:
+        The pages and the new OCR results, which the parent process saves
+    """
+    extractor = PDFExtractor(**options)
+    extractor._page_range = page_range
+    extractor._is_worker = True
+    pages = list(extractor._iter_sequential())
+    return pages, extractor._ocr_results
+
 
 def main():
     """Main entry point for command-line usage."""
@@ -580,31 +1691,44 @@ Examples:
   # Generate text report
   python pdf_extractor.py document.pdf --output report.txt --format text
 
+  # One JSON record per line, for streaming pipelines
+  python pdf_extractor.py document.pdf --output pages.ndjson --format ndjson
+
   # Include base64 image data in JSON
   python pdf_extractor.py document.pdf --output data.json --include-base64
+
+  # Extract pages with 4 worker processes
+  python pdf_extractor.py document.pdf --output data.json --threads 4
         """
     )
 
     parser.add_argument('pdf_path', help='Path to PDF file')
     parser.add_argument('-o', '--output', help='Output file path')
-    parser.add_argument('--format', choices=['json', 'text'], default='json',
-                        help='Output format (default: json)')
+    parser.add_argument('--format', choices=['json', 'ndjson', 'text'], default='json',
+                        help='Output format (default: json); ndjson writes one compact '
+                             'JSON record per page')
     parser.add_argument('--extract-images', action='store_true',
                         help='Extract images from PDF')
     parser.add_argument('--images-dir', help='Directory to save extracted images')
     parser.add_argument('--ocr', action='store_true',
                         help='Use OCR on images (requires pytesseract)')
+    parser.add_argument('--ocr-cache', action='store_true',
+                        help='Reuse OCR results from earlier runs, kept in '
+                             '~/.cache/pdf_extractor/ocr_cache.json')
     parser.add_argument('--include-base64', action='store_true',
                         help='Include base64 encoded image data in JSON output')
     parser.add_argument('--ai-analysis', action='store_true',
                         help='Use AI for image description (requires AI integration)')
+    parser.add_argument('--threads', '--workers', dest='workers', type=int, default=1,
+                        metavar='N',
+                        help='Number of worker processes for page extraction (default: 1)')
 
     args = parser.parse_args()
 
     # Validate dependencies
-    if args.ocr and not HAS_TESSERACT:
-        print("Error: OCR requested but pytesseract not installed")
-        print("Install with: pip install pytesseract")
+    if args.ocr and not (HAS_TESSEROCR or HAS_TESSERACT):
+        print("Error: OCR requested but neither tesserocr nor pytesseract is installed")
+        print("Install with: pip install pytesseract (or tesserocr)")
         sys.exit(1)
 
     # Create extractor
@@ -613,21 +1737,20 @@ Examples:
         extract_images=args.extract_images,
         images_dir=args.images_dir,
         use_ocr=args.ocr,
+        ocr_cache=args.ocr_cache,
         include_base64=args.include_base64,
-        use_ai=args.ai_analysis
+        use_ai=args.ai_analysis,
+        workers=args.workers
     )
 
     # Extract content
     try:
-        extraction = extractor.extract()
-
-        # Save output
         if args.output:
-            if args.format == 'json':
-                extractor.save_to_json(extraction, args.output)
-            else:
-                extractor.save_to_text(extraction, args.output)
+            # Write each page as it is extracted rather than holding them all
+            extractor.extract_to_file(args.output, args.format)
         else:
+            extraction = extractor.extract()
+
             # Default: print summary
             print(f"\nExtraction Summary:")
             print(f"  File: {extraction.file_path}")
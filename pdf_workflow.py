@@ -22,30 +22,69 @@ Usage:
     python pdf_workflow.py input.pdf --output accessible.pdf --generate-report
 """
 
+import copy
+import functools
+import importlib.util
+import queue
 import sys
+import threading
 import json
 import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
-try:
-    from pdf_extractor import PDFExtractor, PDFExtraction
-    HAS_EXTRACTOR = True
-except ImportError:
-    HAS_EXTRACTOR = False
-    print("Warning: pdf_extractor not found. Install dependencies.")
-
-try:
-    from pdf_remediator import PDFRemediator
-    HAS_REMEDIATOR = True
-except ImportError:
-    HAS_REMEDIATOR = False
+import numpy as np
+
+# pdf_extractor pulls in pikepdf, PyMuPDF and pdfplumber, so it is imported
+# where extraction happens rather than when this module loads
+if TYPE_CHECKING:
+    import pikepdf
+    from pdf_extractor import PDFExtraction, PageData, ImageData
+
+# The remediator runs as its own script (see _remediate_pdf), so it is only
+# located here, not imported
+HAS_REMEDIATOR = importlib.util.find_spec('pdf_remediator') is not None
+if not HAS_REMEDIATOR:
     print("Warning: pdf_remediator not found.")
 
+# Per-instance __dict__ is dropped where the interpreter supports it, since an
+# image-heavy document can produce tens of thousands of issues
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Buffer size for the accessibility report file
+_REPORT_BUFFER = 1 << 20
+
+# Extracted pages waiting for the page checks; the extractor blocks when the
+# checker falls this far behind
+_PAGE_QUEUE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _has_extractor() -> bool:
+    """Whether pdf_extractor and its dependencies can be imported."""
+    try:
+        import pdf_extractor  # noqa: F401
+    except ImportError:
+        print("Warning: pdf_extractor not found. Install dependencies.")
+        return False
+    return True
+
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _has_pikepdf() -> bool:
+    """Whether pikepdf can be imported."""
+    try:
+        import pikepdf  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+@dataclass(**_SLOTS)
 class AccessibilityIssue:
     """Represents an accessibility issue found in the PDF."""
     issue_type: str
@@ -58,7 +97,7 @@ class AccessibilityIssue:
     auto_fixable: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccessibilityReport:
     """Complete accessibility analysis report."""
     pdf_path: str
@@ -107,10 +146,8 @@ class AccessibilityReport:
             summary.append("-" * 80)
 
             # Group by type
-            by_type = {}
+            by_type = defaultdict(list)
             for issue in self.issues:
-                if issue.issue_type not in by_type:
-                    by_type[issue.issue_type] = []
                 by_type[issue.issue_type].append(issue)
 
             for issue_type, issues in sorted(by_type.items()):
@@ -125,11 +162,114 @@ class AccessibilityReport:
         return "\n".join(summary)
 
 
+# Any document with text gets the same manual contrast check (WCAG 1.4.3);
+# reports receive their own copy
+_CONTRAST_ISSUE = AccessibilityIssue(
+    issue_type="Color Contrast Check Needed",
+    severity="medium",
+    page=0,
+    description="Manual verification of color contrast required",
+    wcag_criterion="1.4.3 Contrast (Minimum)",
+    recommendation="Ensure text has 4.5:1 contrast ratio (3:1 for large text)",
+    auto_fixable=False
+)
+
+
+# Per-page issues differ only in where they were found; the constant fields
+# are bound once here
+_missing_alt_text_issue = functools.partial(
+    AccessibilityIssue,
+    issue_type="Image Missing Alt Text",
+    severity="critical",
+    wcag_criterion="1.1.1 Non-text Content",
+    recommendation="Add descriptive alt text or mark as decorative",
+    auto_fixable=True
+)
+_reading_order_issue = functools.partial(
+    AccessibilityIssue,
+    issue_type="Potential Reading Order Issue",
+    severity="medium",
+    description="Page may have complex layout affecting reading order",
+    wcag_criterion="1.3.2 Meaningful Sequence",
+    recommendation="Verify and optimize reading order for screen readers",
+    auto_fixable=True
+)
+
+
+@dataclass(**_SLOTS)
+class PageFindings:
+    """Results of the page-level accessibility checks for one page."""
+    page_number: int
+    image_issues: List[AccessibilityIssue] = field(default_factory=list)
+    heading_candidates: int = 0
+    reading_order_issue: Optional[AccessibilityIssue] = None
+
+
+def _images_needing_alt_text(images: List["ImageData"]) -> np.ndarray:
+    """
+    Return the indices of images that likely need alt text.
+
+    Images that are tiny or larger than a page (likely decorative), and
+    images whose OCR already produced text, are skipped. The predicate is
+    evaluated on width/height columns for all images at once.
+    """
+    count = len(images)
+    if not count:
+        return np.empty(0, dtype=np.intp)
+
+    widths = np.fromiter((img.width for img in images), dtype=np.int64, count=count)
+    heights = np.fromiter((img.height for img in images), dtype=np.int64, count=count)
+    areas = np.fromiter((img.area for img in images), dtype=np.int64, count=count)
+    has_text = np.fromiter((bool(img.ocr_text) for img in images), dtype=bool, count=count)
+
+    likely_decorative = ((widths < 20) | (heights < 20) | (areas < 400) |
+                         (widths > 1500) | (heights > 1500))
+    return np.flatnonzero(~likely_decorative & ~has_text)
+
+
+def check_page(page: "PageData") -> PageFindings:
+    """
+    Run every page-level accessibility check on one page.
+
+    Depends only on the page, so pages can be checked in any order or in
+    other processes and the findings merged afterwards.
+    """
+    from pdf_extractor import spans_columns
+
+    findings = PageFindings(page_number=page.page_number)
+
+    # Images without alt text (WCAG 1.1.1)
+    for i in _images_needing_alt_text(page.images).tolist():
+        img = page.images[i]
+        findings.image_issues.append(_missing_alt_text_issue(
+            page=page.page_number,
+            description=f"Image '{img.name}' ({img.width}x{img.height}) needs alt text",
+            location=f"({img.x0:.0f}, {img.y0:.0f})"
+        ))
+
+    # Heading-like text (WCAG 1.3.1): large font sizes, counted in one
+    # vectorised comparison over the page's cached font-size array
+    findings.heading_candidates = int(np.count_nonzero(page.font_sizes_np > 16))
+
+    # Multi-column layouts that might have ordering issues (WCAG 1.3.2):
+    # word left edges spanning more than 70% of the page width
+    if len(page.words) > 50 and spans_columns(page.x0_np, page.width):
+        findings.reading_order_issue = _reading_order_issue(page=page.page_number)
+
+    return findings
+
+
 class PDFAccessibilityAnalyzer:
     """Analyzes PDF extraction data for accessibility issues."""
 
-    def __init__(self, extraction: PDFExtraction):
+    def __init__(self, extraction: "PDFExtraction", workers: int = 1):
+        """
+        Args:
+            extraction: Extracted PDF content to analyze
+            workers: Number of processes to run the page checks in
+        """
         self.extraction = extraction
+        self.workers = max(1, workers)
         self.report = AccessibilityReport(
             pdf_path=extraction.file_path,
             total_pages=extraction.num_pages,
@@ -137,19 +277,46 @@ class PDFAccessibilityAnalyzer:
             total_images=extraction.total_images
         )
 
-    def analyze(self) -> AccessibilityReport:
-        """Run complete accessibility analysis."""
+    def analyze(self, findings: Optional[List[PageFindings]] = None) -> AccessibilityReport:
+        """
+        Run complete accessibility analysis.
+
+        Args:
+            findings: check_page() results for every page, in page order, if
+                they were already computed (for example while the document
+                was being extracted); computed here when omitted
+
+        Returns:
+            The completed AccessibilityReport
+        """
         print("Analyzing PDF for accessibility issues...")
 
         self._check_metadata()
-        self._check_images()
-        self._check_document_structure()
-        self._check_reading_order()
+
+        if findings is None:
+            findings = self._check_pages()
+        self._check_images(findings)
+        self._check_document_structure(findings)
+        self._check_reading_order(findings)
+
         self._check_color_contrast()
 
         print(f"Analysis complete: {len(self.report.issues)} issues found")
         return self.report
 
+    def _check_pages(self) -> List[PageFindings]:
+        """Run the page-level checks, in worker processes if requested."""
+        pages = self.extraction.pages
+        if self.workers == 1 or len(pages) < 2:
+            return [check_page(page) for page in pages]
+
+        # Findings come back in page order, so issues are reported exactly as
+        # in a sequential run
+        workers = min(self.workers, len(pages))
+        chunksize = max(1, len(pages) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(check_page, pages, chunksize=chunksize))
+
     def _check_metadata(self) -> None:
         """Check document metadata (WCAG 2.4.2)."""
         if not self.extraction.title or len(self.extraction.title.strip()) == 0:
@@ -174,102 +341,172 @@ class PDFAccessibilityAnalyzer:
                 auto_fixable=False
             ))
 
-    def _check_images(self) -> None:
-        """Check images for alt text (WCAG 1.1.1)."""
+    def _check_images(self, findings: List[PageFindings]) -> None:
+        """Report images missing alt text (WCAG 1.1.1)."""
         images_without_alt = 0
 
-        for page in self.extraction.pages:
-            for img in page.images:
-                # Check if image likely needs alt text (not decorative)
-                is_likely_decorative = (
-                    img.width < 20 or img.height < 20 or
-                    (img.width * img.height < 400) or
-                    img.width > 1500 or img.height > 1500
-                )
-
-                if not is_likely_decorative and not img.ocr_text:
-                    images_without_alt += 1
-                    self.report.add_issue(AccessibilityIssue(
-                        issue_type="Image Missing Alt Text",
-                        severity="critical",
-                        page=page.page_number,
-                        description=f"Image '{img.name}' ({img.width}x{img.height}) needs alt text",
-                        wcag_criterion="1.1.1 Non-text Content",
-                        recommendation="Add descriptive alt text or mark as decorative",
-                        location=f"({img.x0:.0f}, {img.y0:.0f})",
-                        auto_fixable=True
-                    ))
+        for page_findings in findings:
+            for issue in page_findings.image_issues:
+                images_without_alt += 1
+                self.report.add_issue(issue)
 
         if images_without_alt > 0:
             print(f"  Found {images_without_alt} images needing alt text")
 
-    def _check_document_structure(self) -> None:
+    def _check_document_structure(self, findings: List[PageFindings]) -> None:
         """Check for proper document structure (WCAG 1.3.1)."""
-        # Check for heading-like text (large font sizes)
-        heading_candidates = []
-
-        for page in self.extraction.pages:
-            for word in page.words:
-                if word.font_size > 16:  # Likely a heading
-                    heading_candidates.append((page.page_number, word.text, word.font_size))
-
-        if heading_candidates:
+        # Heading-like text (large font sizes) across the whole document: the
+        # issue reports the total and the first page with a candidate, so one
+        # pass keeps just those instead of listing every page
+        heading_count = 0
+        first_page = None
+        for page_findings in findings:
+            if page_findings.heading_candidates:
+                heading_count += page_findings.heading_candidates
+                if first_page is None:
+                    first_page = page_findings.page_number
+
+        if heading_count:
             self.report.add_issue(AccessibilityIssue(
                 issue_type="Potential Untagged Headings",
                 severity="high",
-                page=heading_candidates[0][0],
-                description=f"Found {len(heading_candidates)} potential headings with large font sizes",
+                page=first_page,
+                description=f"Found {heading_count} potential headings with large font sizes",
                 wcag_criterion="1.3.1 Info and Relationships",
                 recommendation="Tag text with proper heading levels (H1, H2, etc.)",
                 auto_fixable=True
             ))
 
-    def _check_reading_order(self) -> None:
-        """Check reading order issues (WCAG 1.3.2)."""
-        for page in self.extraction.pages:
-            # Check for multi-column layouts that might have ordering issues
-            if len(page.words) > 50:
-                # Check if words are scattered across x-coordinates
-                x_coords = [w.x0 for w in page.words]
-                if x_coords:
-                    x_range = max(x_coords) - min(x_coords)
-                    if x_range > page.width * 0.7:  # Spans more than 70% of page width
-                        self.report.add_issue(AccessibilityIssue(
-                            issue_type="Potential Reading Order Issue",
-                            severity="medium",
-                            page=page.page_number,
-                            description="Page may have complex layout affecting reading order",
-                            wcag_criterion="1.3.2 Meaningful Sequence",
-                            recommendation="Verify and optimize reading order for screen readers",
-                            auto_fixable=True
-                        ))
+    def _check_reading_order(self, findings: List[PageFindings]) -> None:
+        """Report pages with possible reading order issues (WCAG 1.3.2)."""
+        for page_findings in findings:
+            if page_findings.reading_order_issue is not None:
+                self.report.add_issue(page_findings.reading_order_issue)
 
     def _check_color_contrast(self) -> None:
         """Check for potential color contrast issues (WCAG 1.4.3)."""
         # This is a basic check - full contrast checking requires color information
-        total_words = sum(len(p.words) for p in self.extraction.pages)
-
-        if total_words > 0:
-            self.report.add_issue(AccessibilityIssue(
-                issue_type="Color Contrast Check Needed",
-                severity="medium",
-                page=0,
-                description="Manual verification of color contrast required",
-                wcag_criterion="1.4.3 Contrast (Minimum)",
-                recommendation="Ensure text has 4.5:1 contrast ratio (3:1 for large text)",
-                auto_fixable=False
-            ))
+        if self.extraction.total_words > 0:
+            self.report.add_issue(copy.copy(_CONTRAST_ISSUE))
+
+
+# Structure element types that mark a heading
+_HEADING_TAGS = frozenset(['/H', '/H1', '/H2', '/H3', '/H4', '/H5', '/H6'])
+
+
+def _scan_struct_tree(pdf: "pikepdf.Pdf") -> Tuple[bool, int, bool]:
+    """
+    Walk a document's logical structure tree.
+
+    Args:
+        pdf: Open pikepdf document
+
+    Returns:
+        (is_tagged, number of elements with /Alt text, has heading elements)
+    """
+    import pikepdf
+
+    root = pdf.Root.get('/StructTreeRoot')
+    if root is None:
+        return False, 0, False
+
+    alt_count = 0
+    has_heading = False
+    seen = set()
+    stack = [root.get('/K')]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, pikepdf.Array):
+            stack.extend(node)
+            continue
+        if not isinstance(node, pikepdf.Dictionary):
+            continue  # marked-content ids and anything unexpected
+        if node.is_indirect:
+            if node.objgen in seen:
+                continue
+            seen.add(node.objgen)
+        if '/Alt' in node and str(node.Alt).strip():
+            alt_count += 1
+        if str(node.get('/S', '')) in _HEADING_TAGS:
+            has_heading = True
+        kids = node.get('/K')
+        if kids is not None:
+            stack.append(kids)
+
+    return True, alt_count, has_heading
+
+
+def remaining_issues(pdf: "pikepdf.Pdf",
+                     issues: List[AccessibilityIssue]) -> List[AccessibilityIssue]:
+    """
+    Return the issues from an earlier analysis that a document still has.
+
+    Remediation adds tags, alt text and metadata without touching words or
+    images, so instead of re-extracting the document this only reads its
+    document information and structure tree. Issues that can only be
+    checked by hand stay open.
+
+    Args:
+        pdf: Open pikepdf document (normally the remediated copy)
+        issues: Issues found in the original document
+
+    Returns:
+        Issues that are still unresolved, in their original order
+    """
+    docinfo = pdf.docinfo
+    has_title = bool(str(docinfo.get('/Title', '')).strip())
+    has_author = bool(str(docinfo.get('/Author', '')).strip())
+    is_tagged, alt_count, has_heading = _scan_struct_tree(pdf)
+
+    remaining = []
+    for issue in issues:
+        if issue.issue_type == "Missing Document Title":
+            resolved = has_title
+        elif issue.issue_type == "Missing Author":
+            resolved = has_author
+        elif issue.issue_type == "Image Missing Alt Text":
+            # Each element carrying alt text accounts for one image
+            resolved = alt_count > 0
+            alt_count -= resolved
+        elif issue.issue_type == "Potential Untagged Headings":
+            resolved = has_heading
+        elif issue.issue_type == "Potential Reading Order Issue":
+            # A structure tree defines the reading order explicitly
+            resolved = is_tagged
+        else:
+            resolved = False
+        if not resolved:
+            remaining.append(issue)
+    return remaining
 
 
 class PDFAccessibilityWorkflow:
     """Complete workflow: extract, analyze, and remediate PDFs."""
 
     def __init__(self, pdf_path: str, output_path: Optional[str] = None,
-                 use_ai: bool = False, generate_report: bool = False):
+                 use_ai: bool = False, generate_report: bool = False,
+                 full_verify: bool = False, workers: int = 1):
+        """
+        Args:
+            pdf_path: PDF to analyze
+            output_path: Where to write the remediated PDF; None to only analyze
+            use_ai: Use AI for image descriptions
+            generate_report: Write a detailed accessibility report file
+            full_verify: Verify remediation by re-extracting and re-analyzing
+                the output instead of reading its tags and metadata
+            workers: Number of processes to extract pages with, and to run
+                the page checks in when they are not done during extraction
+        """
         self.pdf_path = Path(pdf_path)
         self.output_path = Path(output_path) if output_path else None
         self.use_ai = use_ai
         self.generate_report = generate_report
+        self.full_verify = full_verify
+        self.workers = max(1, workers)
+        self.report: Optional[AccessibilityReport] = None
+        self._json_writer: Optional[threading.Thread] = None
+        self._json_path: Optional[Path] = None
+        self._json_errors: List[Exception] = []
 
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF not found: {pdf_path}")
@@ -281,18 +518,17 @@ class PDFAccessibilityWorkflow:
         Returns:
             Tuple of (AccessibilityReport, success_bool)
         """
-        print("=" * 80)
-        print("PDF Accessibility Workflow")
-        print("=" * 80)
-        print(f"\nInput: {self.pdf_path}")
+        # Banner and step headings are emitted as one block each
+        lines = ["=" * 80, "PDF Accessibility Workflow", "=" * 80,
+                 f"\nInput: {self.pdf_path}"]
         if self.output_path:
-            print(f"Output: {self.output_path}")
-        print()
+            lines.append(f"Output: {self.output_path}")
+        lines.append("")
 
         # Step 1: Extract content
-        print("Step 1: Extracting PDF content...")
-        print("-" * 80)
-        extraction = self._extract_content()
+        lines += ["Step 1: Extracting PDF content...", "-" * 80]
+        print("\n".join(lines))
+        extraction, findings = self._extract_content()
 
         if not extraction:
             print("✗ Extraction failed")
@@ -301,93 +537,166 @@ class PDFAccessibilityWorkflow:
         print(f"✓ Extracted {extraction.total_words} words and {extraction.total_images} images")
 
         # Step 2: Analyze for accessibility issues
-        print("\nStep 2: Analyzing accessibility...")
-        print("-" * 80)
-        report = self._analyze_accessibility(extraction)
-
-        print(f"✓ Found {len(report.issues)} accessibility issues")
-        print(f"  Critical: {report.critical_count}")
-        print(f"  High: {report.high_count}")
-        print(f"  Medium: {report.medium_count}")
-        print(f"  Low: {report.low_count}")
+        print("\nStep 2: Analyzing accessibility...\n" + "-" * 80)
+        report = self._analyze_accessibility(extraction, findings)
+        self.report = report
+
+        print("\n".join([
+            f"✓ Found {len(report.issues)} accessibility issues",
+            f"  Critical: {report.critical_count}",
+            f"  High: {report.high_count}",
+            f"  Medium: {report.medium_count}",
+            f"  Low: {report.low_count}",
+        ]))
 
         # Generate analysis report if requested
         if self.generate_report:
             report_path = self.pdf_path.parent / f"{self.pdf_path.stem}_accessibility_report.txt"
-            with report_path.open('w', encoding='utf-8') as f:
-                f.write(report.get_summary())
-                f.write("\n\n")
-                f.write("Detailed Issues:\n")
-                f.write("=" * 80 + "\n\n")
-                for i, issue in enumerate(report.issues, 1):
-                    f.write(f"{i}. {issue.issue_type}\n")
-                    f.write(f"   Page: {issue.page}\n")
-                    f.write(f"   Severity: {issue.severity}\n")
-                    f.write(f"   WCAG: {issue.wcag_criterion}\n")
-                    f.write(f"   Description: {issue.description}\n")
-                    f.write(f"   Recommendation: {issue.recommendation}\n")
-                    if issue.location:
-                        f.write(f"   Location: {issue.location}\n")
-                    f.write(f"   Auto-fixable: {issue.auto_fixable}\n")
-                    f.write("\n")
+            # Build the whole report in memory and hand it to the file in one
+            # write rather than issuing several small writes per issue
+            chunks = [report.get_summary(), "\n\nDetailed Issues:\n", "=" * 80 + "\n\n"]
+            for i, issue in enumerate(report.issues, 1):
+                location = f"   Location: {issue.location}\n" if issue.location else ""
+                chunks.append(
+                    f"{i}. {issue.issue_type}\n"
+                    f"   Page: {issue.page}\n"
+                    f"   Severity: {issue.severity}\n"
+                    f"   WCAG: {issue.wcag_criterion}\n"
+                    f"   Description: {issue.description}\n"
+                    f"   Recommendation: {issue.recommendation}\n"
+                    f"{location}"
+                    f"   Auto-fixable: {issue.auto_fixable}\n\n"
+                )
+            with report_path.open('w', encoding='utf-8', buffering=_REPORT_BUFFER) as f:
+                f.write("".join(chunks))
             print(f"\n✓ Analysis report saved to: {report_path}")
 
         # Step 3: Remediate (if output path specified)
+        success = True
         if self.output_path:
-            print("\nStep 3: Remediating PDF...")
-            print("-" * 80)
+            print("\nStep 3: Remediating PDF...\n" + "-" * 80)
             success = self._remediate_pdf(extraction, report)
 
             if success:
                 print(f"✓ Remediated PDF saved to: {self.output_path}")
 
                 # Step 4: Optional verification
-                print("\nStep 4: Verifying improvements...")
-                print("-" * 80)
+                print("\nStep 4: Verifying improvements...\n" + "-" * 80)
                 self._verify_remediation()
             else:
                 print("✗ Remediation failed")
-                return report, False
         else:
-            print("\nSkipping remediation (no output path specified)")
-            print("Use --output to remediate the PDF")
+            print("\nSkipping remediation (no output path specified)\n"
+                  "Use --output to remediate the PDF")
+
+        # The extraction data file was written in the background while the
+        # report, remediation and verification ran
+        self._wait_for_extraction_json()
 
-        print("\n" + "=" * 80)
-        print("Workflow Complete")
-        print("=" * 80)
+        if not success:
+            return report, False
+
+        print("\n".join(["\n" + "=" * 80, "Workflow Complete", "=" * 80]))
 
         return report, True
 
-    def _extract_content(self) -> Optional[PDFExtraction]:
-        """Extract all content from PDF."""
-        if not HAS_EXTRACTOR:
+    def _extract_content(self) -> Tuple[Optional["PDFExtraction"], Optional[List[PageFindings]]]:
+        """
+        Extract all content from PDF, running the page checks alongside.
+
+        Each page is handed to a checker thread through a bounded queue as
+        soon as it is extracted, so the per-page accessibility checks overlap
+        with extracting the following pages.
+
+        Returns:
+            Tuple of (PDFExtraction, page findings in page order), or
+            (None, None) if extraction failed
+        """
+        if not _has_extractor():
             print("Error: PDF extractor not available")
-            return None
+            return None, None
+
+        from pdf_extractor import PDFExtractor
 
         try:
             extractor = PDFExtractor(
                 pdf_path=str(self.pdf_path),
-                extract_images=True
+                extract_images=True,
+                workers=self.workers
             )
-            extraction = extractor.extract()
 
-            # Save extraction data for reference
+            pages: "queue.Queue[Optional[PageData]]" = queue.Queue(maxsize=_PAGE_QUEUE_SIZE)
+            findings: List[PageFindings] = []
+            errors: List[Exception] = []
+
+            def check_pages() -> None:
+                # Keep draining after a failure so the extractor never blocks
+                while True:
+                    page = pages.get()
+                    if page is None:
+                        return
+                    if not errors:
+                        try:
+                            findings.append(check_page(page))
+                        except Exception as e:
+                            errors.append(e)
+
+            checker = threading.Thread(target=check_pages, name="pdf-page-checker", daemon=True)
+            checker.start()
+            try:
+                extraction = extractor.extract(on_page=pages.put)
+            finally:
+                pages.put(None)
+                checker.join()
+            if errors:
+                raise errors[0]
+
+            # Save extraction data for reference on a background thread; the
+            # analysis only reads the in-memory extraction, so it does not
+            # wait for the file. run() joins the thread once everything else
+            # is done.
             extraction_path = self.pdf_path.parent / f"{self.pdf_path.stem}_extraction.json"
-            extractor.save_to_json(extraction, str(extraction_path))
-            print(f"  Extraction data saved to: {extraction_path}")
+            self._json_path = extraction_path
+
+            def save_json() -> None:
+                try:
+                    extractor.save_to_json(extraction, str(extraction_path), quiet=True)
+                except Exception as e:
+                    self._json_errors.append(e)
+
+            self._json_errors.clear()
+            self._json_writer = threading.Thread(target=save_json, name="pdf-extraction-json")
+            self._json_writer.start()
 
-            return extraction
+            return extraction, findings
 
         except Exception as e:
             print(f"Error during extraction: {e}")
-            return None
+            return None, None
+
+    def _wait_for_extraction_json(self) -> None:
+        """
+        Wait for the extraction data file to be written and report it.
+
+        The file is only kept for reference, so failing to write it is a
+        warning and does not fail the workflow.
+        """
+        if self._json_writer is None:
+            return
+        self._json_writer.join()
+        self._json_writer = None
+        if self._json_errors:
+            print(f"  Warning: Could not save extraction data: {self._json_errors[0]}")
+        else:
+            print(f"  Extraction data saved to: {self._json_path}")
 
-    def _analyze_accessibility(self, extraction: PDFExtraction) -> AccessibilityReport:
+    def _analyze_accessibility(self, extraction: "PDFExtraction",
+                               findings: Optional[List[PageFindings]] = None) -> AccessibilityReport:
         """Analyze extraction data for accessibility issues."""
-        analyzer = PDFAccessibilityAnalyzer(extraction)
-        return analyzer.analyze()
+        analyzer = PDFAccessibilityAnalyzer(extraction, workers=self.workers)
+        return analyzer.analyze(findings)
 
-    def _remediate_pdf(self, extraction: PDFExtraction, report: AccessibilityReport) -> bool:
+    def _remediate_pdf(self, extraction: "PDFExtraction", report: AccessibilityReport) -> bool:
         """Remediate the PDF using the remediator."""
         if not HAS_REMEDIATOR:
             print("Error: PDF remediator not available")
@@ -408,7 +717,8 @@ class PDFAccessibilityWorkflow:
             auto_fixable = sum(1 for issue in report.issues if issue.auto_fixable)
             print(f"  Auto-fixing {auto_fixable} issues...")
 
-            # Import and use remediator
+            # Run the remediator in its own interpreter: it parses sys.argv
+            # and may sys.exit(), and neither may touch this process
             import subprocess
             result = subprocess.run([
                 sys.executable,
@@ -430,25 +740,37 @@ class PDFAccessibilityWorkflow:
 
     def _verify_remediation(self) -> None:
         """Verify the remediated PDF."""
-        if not self.output_path or not self.output_path.exists():
+        if not self.output_path or not self.output_path.exists() or self.report is None:
             return
 
         try:
-            # Re-extract and re-analyze
-            extractor = PDFExtractor(
-                pdf_path=str(self.output_path),
-                extract_images=True
-            )
-            new_extraction = extractor.extract()
+            if self.full_verify or not _has_pikepdf():
+                # Re-extract and re-analyze
+                from pdf_extractor import PDFExtractor
+
+                extractor = PDFExtractor(
+                    pdf_path=str(self.output_path),
+                    extract_images=True,
+                    workers=self.workers
+                )
+                new_extraction = extractor.extract()
 
-            analyzer = PDFAccessibilityAnalyzer(new_extraction)
-            new_report = analyzer.analyze()
+                analyzer = PDFAccessibilityAnalyzer(new_extraction, workers=self.workers)
+                after_issues = analyzer.analyze().issues
+            else:
+                # Remediation only adds tags and metadata, so reading those is
+                # enough; words and images are not extracted again
+                import pikepdf
 
-            print(f"  Before: {len(self.report.issues)} issues")
-            print(f"  After: {len(new_report.issues)} issues")
+                with pikepdf.open(self.output_path) as pdf:
+                    after_issues = remaining_issues(pdf, self.report.issues)
 
-            if len(new_report.issues) < len(self.report.issues):
-                print(f"  ✓ Improved: {len(self.report.issues) - len(new_report.issues)} issues fixed")
+            before = len(self.report.issues)
+            after = len(after_issues)
+            lines = [f"  Before: {before} issues", f"  After: {after} issues"]
+            if after < before:
+                lines.append(f"  ✓ Improved: {before - after} issues fixed")
+            print("\n".join(lines))
 
         except Exception as e:
             print(f"  Could not verify: {e}")
@@ -483,10 +805,16 @@ Examples:
                         help='Use AI for image descriptions (requires API key)')
     parser.add_argument('--generate-report', action='store_true',
                         help='Generate detailed accessibility report')
+    parser.add_argument('--full-verify', action='store_true',
+                        help='Verify by re-extracting and re-analyzing the output '
+                             '(default: check its tags and metadata only)')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='Number of worker processes for extraction and '
+                             'page checks (default: 1)')
 
     args = parser.parse_args()
 
-    if not HAS_EXTRACTOR:
+    if not _has_extractor():
         print("Error: PDF extractor not available")
         print("Install required packages: pip install -r requirements_extractor.txt")
         sys.exit(1)
@@ -498,7 +826,9 @@ Examples:
         pdf_path=args.pdf_path,
         output_path=output_path,
         use_ai=args.use_ai,
-        generate_report=args.generate_report
+        generate_report=args.generate_report,
+        full_verify=args.full_verify,
+        workers=args.workers
     )
 
     # Run workflow
@@ -6,10 +6,17 @@ This script validates the PDF extractor functionality.
 Run with a sample PDF to test extraction capabilities.
 """
 
+import contextlib
+import io
 import sys
+import re
+import tempfile
 from pathlib import Path
 import json
 
+# Names of the checks below that failed; the script exits non-zero if any did
+failures = []
+
 # Test imports
 print("Testing imports...")
 try:
@@ -27,7 +34,10 @@ except ImportError:
     print("  Install: pip install pikepdf")
 
 try:
-    import PyMuPDF
+    try:
+        import pymupdf
+    except ImportError:
+        import fitz
     print("✓ PyMuPDF installed (recommended)")
 except ImportError:
     print("⚠ PyMuPDF not installed (recommended for best results)")
@@ -129,6 +139,428 @@ try:
 except Exception as e:
     print(f"✗ Serialization error: {e}")
 
+print("\n" + "=" * 80)
+print("Testing Cached Word Columns")
+print("=" * 80)
+
+try:
+    page = PageData(page_number=1, width=612.0, height=792.0, rotation=0,
+                    word_count=0, image_count=0)
+    page.words = [WordInfo("alpha", 1, 10.0, 20.0, 50.0, 35.0, 40.0, 15.0, font_size=12.0)]
+    assert page.font_sizes_np.tolist() == [12.0]
+
+    # Same-length replacement must not return the previous page's columns
+    page.words = [WordInfo("beta", 1, 99.0, 20.0, 130.0, 35.0, 31.0, 15.0, font_size=18.0)]
+    assert page.font_sizes_np.tolist() == [18.0]
+    assert page.x0_np.tolist() == [99.0]
+    assert page.find_words(re.compile("beta")).tolist() == [0]
+
+    # In-place edits are picked up after invalidate_columns()
+    page.words[0].font_size = 24.0
+    page.invalidate_columns()
+    assert page.font_sizes_np.tolist() == [24.0]
+    print("✓ Word columns follow changes to page.words")
+
+except Exception as e:
+    failures.append("cached word columns")
+    print(f"✗ Cached word column error: {e!r}")
+
+try:
+    import numpy as np
+    from pdf_extractor import _text_from_words
+
+    # Words arrive out of order; tops within 3pt share a line
+    texts = ["world", "Second", "Hello", "line", "Third"]
+    tops = np.array([100.0, 120.0, 101.5, 119.0, 140.0])
+    x0 = np.array([60.0, 12.0, 10.0, 70.0, 10.0])
+    assert _text_from_words(texts, tops, x0) == "Hello world\nSecond line\nThird"
+
+    # A wider tolerance merges the first two rows
+    assert _text_from_words(texts, tops, x0, y_tolerance=18) == "Hello Second world line\nThird"
+    assert _text_from_words([], np.empty(0), np.empty(0)) == ""
+    print("✓ _text_from_words() groups rows and reads them left to right")
+
+except Exception as e:
+    failures.append("_text_from_words")
+    print(f"✗ _text_from_words error: {e!r}")
+
+print("\n" + "=" * 80)
+print("Testing With Generated PDFs")
+print("=" * 80)
+
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+
+fixtures = tempfile.TemporaryDirectory(prefix="pdf_extractor_test_")
+fixture_dir = Path(fixtures.name)
+
+
+def make_pdf(name, pages, image=False, metadata=None):
+    """Write a PDF with one page per list of (text, fontname, fontsize) lines."""
+    doc = fitz.open()
+    if metadata:
+        doc.set_metadata(metadata)
+    for lines in pages:
+        page = doc.new_page(width=612, height=792)
+        y = 72
+        for text, fontname, fontsize in lines:
+            page.insert_text((72, y), text, fontname=fontname, fontsize=fontsize)
+            y += fontsize * 2
+        if image:
+            pix = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 40), False)
+            pix.set_rect(pix.irect, (200, 30, 30))
+            page.insert_image(fitz.Rect(300, 300, 360, 340), stream=pix.tobytes("png"))
+    path = fixture_dir / name
+    doc.save(str(path))
+    return str(path)
+
+
+if fitz is None:
+    print("⚠ PyMuPDF not installed; skipping tests that need generated PDFs")
+else:
+    try:
+        import pdf_extractor
+
+        # A failed image write must not leave file_path pointing at nothing
+        pdf_path = make_pdf("images.pdf", [[("Image page", "helv", 12)]] * 2, image=True)
+        real_write_file = pdf_extractor._write_file
+
+        def failing_write_file(path, data):
+            raise OSError("disk full")
+
+        pdf_extractor._write_file = failing_write_file
+        try:
+            extractor = PDFExtractor(pdf_path, extract_images=True,
+                                     images_dir=str(fixture_dir / "images"))
+            pages = list(extractor.iter_pages())
+        finally:
+            pdf_extractor._write_file = real_write_file
+        assert [img.file_path for p in pages for img in p.images] == [None, None]
+        print("✓ Images whose file could not be written have no file_path")
+
+    except Exception as e:
+        failures.append("image write failures")
+        print(f"✗ Image write failure error: {e!r}")
+
+    try:
+
+        # Without image files to write, a page is handed out as soon as it
+        # has been extracted rather than after the next one
+        four_pages = make_pdf("four_pages.pdf", [[(f"Page {n} text", "helv", 12)] for n in range(4)])
+        progress = io.StringIO()
+        with contextlib.redirect_stdout(progress):
+            pages = PDFExtractor(four_pages, extract_images=False).iter_pages()
+            first = next(pages)
+            extracted = progress.getvalue().count("Processing page")
+            pages.close()
+        assert first.page_number == 1 and extracted == 1, extracted
+        print("✓ Taking one page from iter_pages() extracts exactly one page")
+
+    except Exception as e:
+        failures.append("iter_pages look-ahead")
+        print(f"✗ iter_pages look-ahead error: {e!r}")
+
+    try:
+        import types
+
+        # tesserocr that cannot start (e.g. no tessdata) must not abort the
+        # extraction: OCR falls back to pytesseract, or is skipped
+        def broken_api():
+            raise RuntimeError("Failed to init API, possibly an invalid tessdata path")
+
+        stub_pytesseract = types.SimpleNamespace(
+            image_to_string=lambda img: f"text {img.width}x{img.height}",
+            get_tesseract_version=lambda: "stub")
+        ocr_pdf = make_pdf("ocr.pdf", [[("Image page", "helv", 12)]], image=True)
+        saved = {name: getattr(pdf_extractor, name, None)
+                 for name in ('HAS_TESSEROCR', 'tesserocr', 'HAS_TESSERACT', 'pytesseract')}
+        try:
+            pdf_extractor.HAS_TESSEROCR = True
+            pdf_extractor.tesserocr = types.SimpleNamespace(PyTessBaseAPI=broken_api)
+            for pytesseract_stub, expected in ((None, None), (stub_pytesseract, "text 60x40")):
+                pdf_extractor.HAS_TESSERACT = pytesseract_stub is not None
+                pdf_extractor.pytesseract = pytesseract_stub
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    page = PDFExtractor(ocr_pdf, use_ocr=True, ocr_cache=False).extract().pages[0]
+                assert [img.ocr_text for img in page.images] == [expected]
+                assert output.getvalue().count("Could not start tesserocr") == 1
+        finally:
+            for name, value in saved.items():
+                setattr(pdf_extractor, name, value)
+        print("✓ A tesserocr API that fails to start falls back instead of aborting")
+
+    except Exception as e:
+        failures.append("tesserocr start failure")
+        print(f"✗ tesserocr start failure error: {e!r}")
+
+    try:
+        # A second run with the OCR cache on reads the text back instead of
+        # running OCR again; the file keeps only the most recently used entries
+        ocr_calls = []
+
+        def counting_ocr(img):
+            ocr_calls.append(img.size)
+            return f"text {img.width}x{img.height}"
+
+        stub_pytesseract = types.SimpleNamespace(image_to_string=counting_ocr,
+                                                 get_tesseract_version=lambda: "stub")
+        saved = {name: getattr(pdf_extractor, name, None)
+                 for name in ('HAS_TESSEROCR', 'HAS_TESSERACT', 'pytesseract', '_OCR_CACHE_PATH',
+                              '_OCR_CACHE_MAX_ENTRIES', '_ocr_cache')}
+        try:
+            pdf_extractor.HAS_TESSEROCR = False
+            pdf_extractor.HAS_TESSERACT = True
+            pdf_extractor.pytesseract = stub_pytesseract
+            pdf_extractor._OCR_CACHE_PATH = fixture_dir / "ocr_cache.json"
+            pdf_extractor._ocr_cache = None
+            texts = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(2):
+                    page = PDFExtractor(ocr_pdf, use_ocr=True, ocr_cache=True).extract().pages[0]
+                    texts.append([img.ocr_text for img in page.images])
+                # Off by default: nothing is read from the cache
+                PDFExtractor(ocr_pdf, use_ocr=True).extract()
+            assert texts == [["text 60x40"], ["text 60x40"]], texts
+            assert len(ocr_calls) == 2, ocr_calls
+            cached = json.loads(pdf_extractor._OCR_CACHE_PATH.read_text(encoding="utf-8"))
+            assert list(cached.values()) == ["text 60x40"]
+
+            pdf_extractor._OCR_CACHE_MAX_ENTRIES = 3
+            pdf_extractor._save_ocr_cache({f"k{n}": str(n) for n in range(3)})
+            pdf_extractor._save_ocr_cache({"k0": "0"})
+            cached = json.loads(pdf_extractor._OCR_CACHE_PATH.read_text(encoding="utf-8"))
+            assert list(cached) == ["k1", "k2", "k0"], list(cached)
+        finally:
+            for name, value in saved.items():
+                setattr(pdf_extractor, name, value)
+        print("✓ The OCR cache is opt-in, reused on a second run and capped")
+
+    except Exception as e:
+        failures.append("OCR cache")
+        print(f"✗ OCR cache error: {e!r}")
+
+    try:
+        import numpy as np
+        from PIL import Image
+
+        # Several images are stacked onto one canvas for a single Tesseract
+        # run; the stub finds each dark band on the canvas and reports two
+        # lines of word boxes inside it, as image_to_data does
+        canvases = []
+
+        def boxes_per_band(canvas, output_type=None):
+            canvases.append(canvas.size)
+            dark = np.flatnonzero((np.asarray(canvas) < 128).any(axis=1))
+            starts = dark[np.r_[True, np.diff(dark) > 1]]
+            data = {key: [] for key in ('text', 'top', 'height', 'block_num', 'par_num', 'line_num')}
+            for band, top in enumerate(starts):
+                # Tesseract also reports empty block-level entries
+                for line, words in ((0, ["", f"image{band}", "first"]), (1, ["second", "line"])):
+                    for word in words:
+                        data['text'].append(word)
+                        data['top'].append(int(top) + 2 + line * 10)
+                        data['height'].append(8)
+                        data['block_num'].append(band + 1)
+                        data['par_num'].append(1)
+                        data['line_num'].append(line + 1)
+            return data
+
+        stub_pytesseract = types.SimpleNamespace(image_to_data=boxes_per_band,
+                                                 Output=types.SimpleNamespace(DICT="dict"))
+        sizes = [(60, 40), (120, 25), (30, 70)]
+        batch = [(pdf_extractor.ImageData(page=1, index=i, name=f"page1_img{i}", width=w, height=h,
+                                          x0=0, y0=0, x1=w, y1=h),
+                  Image.new('RGB', (w, h), (20, 20, 90)))
+                 for i, (w, h) in enumerate(sizes)]
+        saved_pytesseract = pdf_extractor.pytesseract
+        try:
+            pdf_extractor.pytesseract = stub_pytesseract
+            PDFExtractor._ocr_batch(batch)
+        finally:
+            pdf_extractor.pytesseract = saved_pytesseract
+        gap = pdf_extractor._OCR_GAP
+        assert canvases == [(120, 40 + 25 + 70 + 2 * gap)], canvases
+        assert [image_data.ocr_text for image_data, _ in batch] == [
+            f"image{i} first\nsecond line" for i in range(3)]
+        print("✓ Batched OCR splits the stacked canvas text back per image")
+
+    except Exception as e:
+        failures.append("batched OCR")
+        print(f"✗ Batched OCR error: {e!r}")
+
+    try:
+        # Worker processes must hand back exactly what one process extracts
+        parallel_pdf = make_pdf("parallel.pdf", [
+            [(f"Section {n}", "hebo", 16), (f"Body text for page {n} with several words.", "helv", 11)]
+            for n in range(1, 8)
+        ], image=True)
+        with contextlib.redirect_stdout(io.StringIO()):
+            sequential = PDFExtractor(parallel_pdf, workers=1).extract()
+            parallel = PDFExtractor(parallel_pdf, workers=3).extract()
+        assert parallel.num_pages == 7 and parallel.total_images == 7
+        assert (parallel.total_words, parallel.total_images) == (sequential.total_words, sequential.total_images)
+        assert [p.to_dict() for p in parallel.pages] == [p.to_dict() for p in sequential.pages]
+        print("✓ Parallel extraction matches sequential extraction")
+
+    except Exception as e:
+        failures.append("parallel extraction")
+        print(f"✗ Parallel extraction error: {e!r}")
+
+    text_pdf = make_pdf("text.pdf", [
+        [("Chapter One", "helv", 20), ("The first page of body text.", "helv", 11)],
+        [("Second page with a few more words on it.", "helv", 11)],
+        [("Third and final page.", "helv", 11)],
+    ], metadata={'title': "Generated Fixture", 'author': "Test Suite"})
+    reference = PDFExtractor(text_pdf, extract_images=False).extract()
+
+    try:
+        extractor = PDFExtractor(text_pdf, extract_images=False)
+        metadata = extractor.extract_metadata()
+        assert (metadata.num_pages, metadata.title, metadata.author) == (3, "Generated Fixture", "Test Suite")
+        assert metadata.pages == [] and metadata.total_words == 0
+
+        pages = list(extractor.iter_pages())
+        assert [p.page_number for p in pages] == [1, 2, 3]
+        assert [p.to_dict() for p in pages] == [p.to_dict() for p in reference.pages]
+        assert reference.total_words == sum(p.word_count for p in pages) > 0
+        print("✓ extract_metadata() and iter_pages() match extract()")
+
+    except Exception as e:
+        failures.append("extract_metadata / iter_pages")
+        print(f"✗ extract_metadata / iter_pages error: {e!r}")
+
+    try:
+        json_path = fixture_dir / "streamed.json"
+        totals = PDFExtractor(text_pdf, extract_images=False).extract_to_file(str(json_path))
+        with open(json_path, encoding="utf-8") as f:
+            data = json.load(f)
+        # Totals are only known after the last page, so they follow "pages"
+        assert list(data)[-3:] == ['pages', 'total_words', 'total_images']
+        assert data['pages'] == [p.to_dict() for p in reference.pages]
+        assert data['title'] == "Generated Fixture"
+        assert (data['total_words'], data['total_images']) == (reference.total_words, reference.total_images)
+        assert (totals.total_words, totals.pages) == (reference.total_words, [])
+        print("✓ extract_to_file() JSON has every page followed by the totals")
+
+        text_path = fixture_dir / "streamed.txt"
+        PDFExtractor(text_pdf, extract_images=False).extract_to_file(str(text_path), output_format='text')
+        report = text_path.read_text(encoding="utf-8")
+        assert report.index("PAGE 1\n") < report.index("PAGE 2\n") < report.index("PAGE 3\n")
+        assert report.index("PAGE 3\n") < report.index(f"Total Words: {reference.total_words}\n")
+        assert report.count("Total Words:") == 1
+        assert "Chapter One" in report
+        print("✓ extract_to_file() text report ends with the totals")
+
+        ndjson_path = fixture_dir / "streamed.ndjson"
+        PDFExtractor(text_pdf, extract_images=False).extract_to_file(str(ndjson_path), output_format='ndjson')
+        with open(ndjson_path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [r.pop('type') for r in records] == ['document', 'page', 'page', 'page', 'totals']
+        assert records[0]['title'] == "Generated Fixture" and 'total_words' not in records[0]
+        assert records[1:-1] == json.loads(json.dumps([p.to_dict() for p in reference.pages]))
+        assert records[-1] == {'total_words': reference.total_words,
+                               'total_images': reference.total_images}
+        print("✓ extract_to_file() NDJSON round-trips one record per line")
+
+    except Exception as e:
+        failures.append("extract_to_file")
+        print(f"✗ extract_to_file error: {e!r}")
+
+    try:
+        styled_pdf = make_pdf("styled.pdf", [[
+            ("Bold heading", "hebo", 16), ("Slanted aside", "heit", 11), ("Plain body", "helv", 11)
+        ]])
+        backends = [("pdfplumber + PyMuPDF", True)]
+        if pdf_extractor.HAS_PYMUPDF:
+            backends.append(("PyMuPDF", False))
+        real_has_pdfplumber = pdf_extractor.HAS_PDFPLUMBER
+        for backend, use_pdfplumber in backends:
+            pdf_extractor.HAS_PDFPLUMBER = real_has_pdfplumber and use_pdfplumber
+            try:
+                page = PDFExtractor(styled_pdf, extract_images=False).extract().pages[0]
+            finally:
+                pdf_extractor.HAS_PDFPLUMBER = real_has_pdfplumber
+            styles = {w.text: (w.is_bold, w.is_italic, round(w.font_size)) for w in page.words}
+            assert styles == {
+                "Bold": (True, False, 16), "heading": (True, False, 16),
+                "Slanted": (False, True, 11), "aside": (False, True, 11),
+                "Plain": (False, False, 11), "body": (False, False, 11),
+            }, (backend, styles)
+            print(f"✓ Bold, italic and font size read from the fonts ({backend})")
+
+    except Exception as e:
+        failures.append("bold / italic words")
+        print(f"✗ Bold / italic error: {e!r}")
+
+    if pdf_extractor.HAS_PDFPLUMBER:
+        try:
+            import pdfplumber
+
+            # One word drawn in three runs of different fonts and sizes
+            doc = fitz.open()
+            page = doc.new_page(width=612, height=792)
+            x = 72
+            for text, fontname, fontsize in (("Hello", "helv", 12), ("World", "hebo", 12),
+                                             (".", "helv", 10)):
+                page.insert_text((x, 100), text, fontname=fontname, fontsize=fontsize)
+                x += fitz.get_text_length(text, fontname=fontname, fontsize=fontsize)
+            page.insert_text((72, 140), "Second line", fontname="helv", fontsize=12)
+            mixed_pdf = str(fixture_dir / "mixed_fonts.pdf")
+            doc.save(mixed_pdf)
+
+            with pdfplumber.open(mixed_pdf) as pdf:
+                expected_text = pdf.pages[0].extract_text()
+            page = PDFExtractor(mixed_pdf, extract_images=False).extract().pages[0]
+            assert [w.text for w in page.words] == ["HelloWorld.", "Second", "line"]
+            assert page.raw_text == expected_text == "HelloWorld.\nSecond line"
+            assert (page.words[0].font_name, page.words[0].font_size) == ("Helvetica", 12)
+            print("✓ Mixed-font words stay whole and raw text matches extract_text()")
+
+        except Exception as e:
+            failures.append("mixed-font words")
+            print(f"✗ Mixed-font word error: {e!r}")
+
+    if pdf_extractor.HAS_PDFPLUMBER:
+        try:
+            import pdfplumber
+
+            # A scanned page: one image and no text operators anywhere
+            doc = fitz.open()
+            pix = fitz.Pixmap(fitz.csGRAY, fitz.IRect(0, 0, 200, 100), False)
+            pix.set_rect(pix.irect, (255,))
+            doc.new_page().insert_image(fitz.Rect(72, 72, 472, 272), stream=pix.tobytes("png"))
+            scanned_pdf = str(fixture_dir / "scanned.pdf")
+            doc.save(scanned_pdf)
+
+            # Text that lives only inside a Form XObject the page paints
+            source = fitz.open(text_pdf)
+            doc = fitz.open()
+            doc.new_page(width=612, height=792).show_pdf_page(fitz.Rect(0, 0, 612, 792), source, 0)
+            form_pdf = str(fixture_dir / "form_xobject.pdf")
+            doc.save(form_pdf)
+            assert b'BT' not in doc[0].read_contents()
+
+            with pdfplumber.open(scanned_pdf) as pdf:
+                assert not PDFExtractor._may_have_text(pdf.pages[0])
+            with pdfplumber.open(form_pdf) as pdf:
+                assert PDFExtractor._may_have_text(pdf.pages[0])
+
+            scanned_page = PDFExtractor(scanned_pdf, extract_images=False).extract().pages[0]
+            assert scanned_page.word_count == 0 and scanned_page.raw_text == ""
+            form_page = PDFExtractor(form_pdf, extract_images=False).extract().pages[0]
+            assert [w.text for w in form_page.words] == [w.text for w in reference.pages[0].words]
+            print("✓ Scanned pages are skipped and Form XObject text is still extracted")
+
+        except Exception as e:
+            failures.append("_may_have_text")
+            print(f"✗ _may_have_text error: {e!r}")
+
 print("\n" + "=" * 80)
 print("Ready for PDF Testing")
 print("=" * 80)
@@ -206,3 +638,7 @@ if len(sys.argv) > 1:
 else:
     print("\nTo test with your own PDF, run:")
     print(f"  python {Path(__file__).name} <your-pdf-file.pdf>")
+
+if failures:
+    print(f"\n✗ {len(failures)} check(s) failed: {', '.join(failures)}")
+    sys.exit(1)
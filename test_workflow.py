@@ -5,7 +5,11 @@ Test script for PDF Workflow Integration
 Validates that the workflow integration is properly set up.
 """
 
+import contextlib
+import io
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
 print("Testing PDF Workflow Integration")
@@ -16,7 +20,6 @@ print("\n1. Checking files...")
 files_to_check = [
     'pdf_extractor.py',
     'pdf_workflow.py',
-    'pdf_remediator.py',
     'requirements_extractor.txt',
     'WORKFLOW_GUIDE.md',
     'examples/complete_workflow.py'
@@ -36,6 +39,13 @@ if not all_exist:
 
 print("\n[OK] All required files present")
 
+# The remediator comes from the PDF Remediator project; without it only the
+# remediation step is unavailable, so the remaining tests still run
+if Path('pdf_remediator.py').exists():
+    print("  [OK] pdf_remediator.py")
+else:
+    print("  [WARN] pdf_remediator.py not found; remediation step unavailable")
+
 # Test 2: Check imports
 print("\n2. Testing imports...")
 
@@ -87,8 +97,105 @@ try:
 except Exception as e:
     print(f"  [ERROR] Data structure error: {e}")
 
-# Test 4: Check documentation
-print("\n4. Checking documentation...")
+# Test 4: Check remediation verification
+print("\n4. Testing remediation verification...")
+
+try:
+    import pikepdf
+    from pdf_workflow import AccessibilityIssue, remaining_issues
+
+    def make_issue(issue_type):
+        return AccessibilityIssue(issue_type=issue_type, severity="high", page=1,
+                                  description="", wcag_criterion="",
+                                  recommendation="", auto_fixable=True)
+
+    issues = [make_issue(t) for t in (
+        "Missing Document Title", "Missing Author",
+        "Image Missing Alt Text", "Image Missing Alt Text", "Image Missing Alt Text",
+        "Potential Untagged Headings", "Potential Reading Order Issue",
+        "Color Contrast Check Needed",
+    )]
+
+    pdf = pikepdf.new()
+    pdf.add_blank_page()
+    assert remaining_issues(pdf, issues) == issues
+    print("  [OK] Untouched PDF keeps every issue")
+
+    # Title, two figures with alt text (one reached twice) and a heading
+    pdf.docinfo['/Title'] = "Remediated"
+    figure = pdf.make_indirect(pikepdf.Dictionary(S=pikepdf.Name.Figure, Alt="A chart"))
+    elements = [
+        pikepdf.Dictionary(S=pikepdf.Name.H1),
+        figure,
+        pikepdf.Dictionary(S=pikepdf.Name.Sect, K=pikepdf.Array([figure])),
+        pikepdf.Dictionary(S=pikepdf.Name.Figure, Alt="A photo"),
+        pikepdf.Dictionary(S=pikepdf.Name.Figure, Alt="  "),
+    ]
+    pdf.Root.StructTreeRoot = pdf.make_indirect(pikepdf.Dictionary(
+        Type=pikepdf.Name.StructTreeRoot, K=pikepdf.Array(elements)))
+
+    remaining = [issue.issue_type for issue in remaining_issues(pdf, issues)]
+    assert remaining == ["Missing Author", "Image Missing Alt Text",
+                         "Color Contrast Check Needed"], remaining
+    print("  [OK] Remediated PDF resolves title, alt text, heading and reading order issues")
+
+except ImportError as e:
+    print(f"  [WARN] Skipped remediation verification: {e}")
+except Exception as e:
+    print(f"  [ERROR] Remediation verification error: {e!r}")
+
+# Test 5: Pipelined page checks
+print("\n5. Testing pipelined page checks...")
+
+try:
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz
+    from pdf_workflow import PDFAccessibilityAnalyzer, PDFAccessibilityWorkflow
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix="pdf_workflow_test_"))
+    try:
+        # Headings, a two-column page with enough words to be checked for
+        # reading order, and an image that needs alt text
+        pdf_path = tmp_dir / "pipelined.pdf"
+        doc = fitz.open()
+        for page_number in range(1, 4):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"Heading {page_number}", fontsize=20)
+            for line in range(30):
+                page.insert_text((50, 110 + line * 20), f"left column line {line}", fontsize=10)
+                if page_number != 2:
+                    page.insert_text((480, 110 + line * 20), f"right {line}", fontsize=10)
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 60, 40), False)
+        pixmap.set_rect(pixmap.irect, (200, 30, 30))
+        doc[2].insert_image(fitz.Rect(300, 700, 420, 780), pixmap=pixmap)
+        doc.save(str(pdf_path))
+        doc.close()
+
+        workflow = PDFAccessibilityWorkflow(str(pdf_path))
+        with contextlib.redirect_stdout(io.StringIO()):
+            extraction, findings = workflow._extract_content()
+            workflow._wait_for_extraction_json()
+            pipelined = PDFAccessibilityAnalyzer(extraction).analyze(findings).issues
+            analyzed = PDFAccessibilityAnalyzer(extraction).analyze().issues
+            parallel = PDFAccessibilityAnalyzer(extraction, workers=2).analyze().issues
+
+        issue_types = {issue.issue_type for issue in analyzed}
+        assert {"Image Missing Alt Text", "Potential Reading Order Issue"} <= issue_types, issue_types
+        assert [f.page_number for f in findings] == [1, 2, 3]
+        assert pipelined == analyzed == parallel
+        print(f"  [OK] Pipelined findings match the analyzer's own page checks ({len(analyzed)} issues)")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+except ImportError as e:
+    print(f"  [WARN] Skipped pipelined page checks: {e}")
+except Exception as e:
+    print(f"  [ERROR] Pipelined page check error: {e!r}")
+
+# Test 6: Check documentation
+print("\n6. Checking documentation...")
 
 docs = {
     'WORKFLOW_GUIDE.md': 'Workflow guide',
@@ -102,8 +209,8 @@ for doc_file, description in docs.items():
     else:
         print(f"  [WARN] {description} not found")
 
-# Test 5: Dependencies check
-print("\n5. Checking dependencies...")
+# Test 7: Dependencies check
+print("\n7. Checking dependencies...")
 
 dependencies = {
     'pikepdf': 'PDF manipulation',
@@ -115,7 +222,10 @@ dependencies = {
 for module, description in dependencies.items():
     try:
         if module == 'PyMuPDF':
-            import fitz
+            try:
+                import pymupdf
+            except ImportError:
+                import fitz
         elif module == 'Pillow':
             from PIL import Image
         else: